@@ -14,10 +14,114 @@ import json
 try:
     import pandas as pd
     import numpy as np
-    from scipy import stats
-    SCIPY_AVAILABLE = True
+    PANDAS_AVAILABLE = True
 except ImportError:
-    SCIPY_AVAILABLE = False
+    PANDAS_AVAILABLE = False
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import polars as pl
+    POLARS_AVAILABLE = True
+except ImportError:
+    POLARS_AVAILABLE = False
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+def _jit(func):
+    """Compile a numeric kernel with numba when available, else run it as plain NumPy."""
+    if NUMBA_AVAILABLE:
+        return njit(cache=True, error_model='numpy')(func)
+    return func
+
+
+@_jit
+def _quartiles(a):
+    """Return q25, median and q75 (linear interpolation) from a single partition."""
+    n = a.shape[0]
+    pos = np.array([0.25, 0.5, 0.75]) * (n - 1)
+    lo = np.floor(pos).astype(np.int64)
+    hi = np.minimum(lo + 1, n - 1)
+    part = np.partition(a, np.concatenate((lo, hi)))
+    return part[lo] + (part[hi] - part[lo]) * (pos - lo)
+
+
+@_jit
+def _iqr_outliers(a, threshold):
+    """Interquartile range outlier mask and bounds."""
+    quartiles = _quartiles(a)
+    iqr = quartiles[2] - quartiles[0]
+    lower = quartiles[0] - threshold * iqr
+    upper = quartiles[2] + threshold * iqr
+    return (a < lower) | (a > upper), lower, upper
+
+
+@_jit
+def _zscore_outliers(a, threshold):
+    """Z-score outlier mask, mean and sample standard deviation."""
+    mean = a.mean()
+    std = np.sqrt(((a - mean) ** 2).sum() / (a.shape[0] - 1))
+    return np.abs((a - mean) / std) > threshold, mean, std
+
+
+@_jit
+def _mad_outliers(a, threshold):
+    """Modified z-score outlier mask, median and median absolute deviation."""
+    median = np.median(a)
+    mad = np.median(np.abs(a - median))
+    return np.abs(0.6745 * (a - median) / mad) > threshold, median, mad
+
+
+def _bincount_dict(codes, offset=0):
+    """Count non-negative integer codes, returning {code + offset: count} for codes present."""
+    counts = np.bincount(codes)
+    present = np.flatnonzero(counts)
+    return dict(zip((present + offset).tolist(), counts[present].tolist()))
+
+
+# Label columns repetitive enough to be worth storing as categoricals
+CATEGORY_COLUMNS = ('camera_model', 'lens_model', 'file_type')
+
+
+def categorize(data: pd.DataFrame, columns=CATEGORY_COLUMNS, max_ratio: float = 0.5) -> pd.DataFrame:
+    """
+    Return data with its repetitive label columns stored as categoricals.
+    
+    value_counts, null checks and groupby then run over small integer codes
+    instead of strings. Only the named columns are considered, so free-text
+    and date string columns keep their dtype (and .str / pd.to_datetime keep
+    working on them). Categories keep first-appearance order so ties in
+    counts and legend order come out as they did for the object column.
+    
+    Args:
+        data: DataFrame to convert (left unchanged)
+        columns: Columns that may be converted
+        max_ratio: Largest distinct/total ratio of a column that gets converted
+    
+    Returns:
+        data itself if no column qualifies, otherwise a converted copy
+    """
+    dtypes = {}
+    for column in columns:
+        if column not in data.columns:
+            continue
+        values = data[column].dropna()
+        if not len(values) or pd.api.types.infer_dtype(values, skipna=False) != 'string':
+            continue
+        uniques = pd.unique(values)
+        if len(uniques) / len(data) < max_ratio:
+            dtypes[column] = pd.CategoricalDtype(uniques)
+    
+    return data.astype(dtypes) if dtypes else data
 
 
 class StatisticalAnalyzer:
@@ -28,24 +132,85 @@ class StatisticalAnalyzer:
     and correlation analysis for metadata fields.
     """
     
-    def __init__(self, data: pd.DataFrame = None):
+    # Aggregations called as GroupBy methods (Cython fast path) instead of via .agg()
+    GROUPBY_METHODS = frozenset({'mean', 'sum', 'count', 'min', 'max', 'std', 'median', 'nunique'})
+    
+    # Columns that are summed (int32 totals wrap past 2 GiB) or need more than
+    # float32's ~7 significant digits, so downcasting leaves them at 64 bits
+    FULL_WIDTH_COLUMNS = frozenset({'file_size', 'duration', 'gps_latitude', 'gps_longitude', 'gps_altitude'})
+    
+    def __init__(self, data: pd.DataFrame = None, downcast: bool = False):
         """
         Initialize the analyzer.
         
         Args:
             data: pandas DataFrame with metadata (optional)
+            downcast: Store numeric columns at 32-bit width (see set_data)
         """
-        if not SCIPY_AVAILABLE:
-            raise ImportError("pandas, numpy, and scipy are required for StatisticalAnalyzer")
+        if not PANDAS_AVAILABLE:
+            raise ImportError("pandas and numpy are required for StatisticalAnalyzer")
         
-        self.data = data
-        self._cache = {}
+        self.set_data(data, downcast=downcast)
     
-    def set_data(self, data: pd.DataFrame):
-        """Set or update the data."""
+    def set_data(self, data: pd.DataFrame, downcast: bool = False):
+        """
+        Set or update the data.
+        
+        Args:
+            data: pandas DataFrame with metadata
+            downcast: Convert float64 columns to float32 and int64 columns to
+                int32 (when their range fits), halving the memory traffic of
+                the numeric kernels at the cost of float32 precision. Columns
+                in FULL_WIDTH_COLUMNS are kept at 64 bits
+        """
+        if data is not None:
+            data = categorize(data)
+            if downcast:
+                data = self._downcast(data)
         self.data = data
+        self._columns = frozenset(data.columns) if data is not None else frozenset()
         self._cache = {}  # Clear cache
     
+    @staticmethod
+    def _downcast(data: pd.DataFrame) -> pd.DataFrame:
+        """Return data with 64-bit numeric columns narrowed to 32 bits where possible."""
+        int32 = np.iinfo(np.int32)
+        dtypes = {}
+        for column in data.columns:
+            if column in StatisticalAnalyzer.FULL_WIDTH_COLUMNS:
+                continue
+            dtype = data[column].dtype
+            if dtype == np.float64:
+                dtypes[column] = np.float32
+            elif dtype == np.int64 and len(data) > 0:
+                if int32.min <= data[column].min() and data[column].max() <= int32.max:
+                    dtypes[column] = np.int32
+        return data.astype(dtypes) if dtypes else data
+    
+    def _numeric_values(self, field: str) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+        """
+        Get the non-null values of a numeric field.
+        
+        Results are cached per field until the data is replaced via set_data.
+        
+        Args:
+            field: Name of the field
+        
+        Returns:
+            Tuple of (values in original dtype, values as float), or None if
+            the field is missing or not numeric. The float array is float64
+            unless the column is already float32.
+        """
+        key = ('numeric', field)
+        if key not in self._cache:
+            entry = None
+            if field in self._columns and pd.api.types.is_numeric_dtype(self.data[field]):
+                values = self.data[field].dropna().to_numpy()
+                floats = values if values.dtype == np.float32 else values.astype(np.float64, copy=False)
+                entry = (values, floats)
+            self._cache[key] = entry
+        return self._cache[key]
+    
     def calculate_descriptive_stats(self, field: str) -> Dict[str, Any]:
         """
         Calculate descriptive statistics for a numeric field.
@@ -56,34 +221,28 @@ class StatisticalAnalyzer:
         Returns:
             Dictionary with statistics
         """
-        if self.data is None or field not in self.data.columns:
-            return {}
+        numeric = self._numeric_values(field)
         
-        series = self.data[field].dropna()
-        
-        if len(series) == 0:
+        if numeric is None or len(numeric[1]) == 0:
             return {}
         
-        if not pd.api.types.is_numeric_dtype(series):
-            return {}
+        arr = numeric[1]
+        q25, median, q75 = _quartiles(arr)
         
         stats_dict = {
-            'count': int(series.count()),
-            'mean': float(series.mean()),
-            'median': float(series.median()),
-            'std': float(series.std()),
-            'min': float(series.min()),
-            'max': float(series.max()),
-            'q25': float(series.quantile(0.25)),
-            'q75': float(series.quantile(0.75)),
+            'count': len(arr),
+            'mean': float(arr.mean()),
+            'median': float(median),
+            'std': float(arr.std(ddof=1)) if len(arr) > 1 else float('nan'),
+            'min': float(arr.min()),
+            'max': float(arr.max()),
+            'q25': float(q25),
+            'q75': float(q75),
         }
         
-        # Mode (can be multiple values)
-        try:
-            mode_result = stats.mode(series, keepdims=True)
-            stats_dict['mode'] = float(mode_result.mode[0])
-        except:
-            pass
+        # Mode (smallest value among ties)
+        values, counts = np.unique(arr, return_counts=True)
+        stats_dict['mode'] = float(values[counts.argmax()])
         
         # Interquartile range
         stats_dict['iqr'] = stats_dict['q75'] - stats_dict['q25']
@@ -105,7 +264,7 @@ class StatisticalAnalyzer:
         Returns:
             List of (value, count) tuples
         """
-        if self.data is None or field not in self.data.columns:
+        if field not in self._columns:
             return []
         
         series = self.data[field].dropna()
@@ -113,6 +272,16 @@ class StatisticalAnalyzer:
         if len(series) == 0:
             return []
         
+        # Small-range integer fields are counted directly, without hashing
+        if pd.api.types.is_integer_dtype(series) and not pd.api.types.is_bool_dtype(series):
+            values = series.to_numpy(dtype=np.int64)
+            low = int(values.min())
+            if int(values.max()) - low < max(len(values), 1 << 16):
+                counts = np.bincount(values - low)
+                order = np.argsort(-counts, kind='stable')[:top_n]
+                order = order[counts[order] > 0]
+                return list(zip((order + low).tolist(), counts[order].tolist()))
+        
         value_counts = series.value_counts()
         return list(value_counts.head(top_n).items())
     
@@ -126,7 +295,7 @@ class StatisticalAnalyzer:
         Returns:
             Dictionary with temporal statistics
         """
-        if self.data is None or date_field not in self.data.columns:
+        if date_field not in self._columns:
             return {}
         
         # Convert to datetime if needed
@@ -144,31 +313,34 @@ class StatisticalAnalyzer:
             'count': len(dates)
         }
         
-        # Group by various time periods
-        df_dates = pd.DataFrame({'date': dates})
+        # Decompose the raw int64 nanosecond buffer once; each component is integer arithmetic
+        if dates.dt.tz is not None:
+            dates = dates.dt.tz_localize(None)
+        dt = dates.to_numpy(dtype='datetime64[ns]')
+        ns = dt.view(np.int64)
+        years = dt.astype('datetime64[Y]').view(np.int64) + 1970
+        months = dt.astype('datetime64[M]').view(np.int64) % 12 + 1
+        dayofweek = (ns // 86_400_000_000_000 + 3) % 7  # 1970-01-01 was a Thursday
+        hours = ns // 3_600_000_000_000 % 24
         
-        # By year
-        df_dates['year'] = df_dates['date'].dt.year
-        analysis['by_year'] = df_dates['year'].value_counts().to_dict()
+        # Group by various time periods; bincount gives counts and mode in one O(N) pass
+        year_counts = _bincount_dict(years - years.min(), offset=int(years.min()))
+        analysis['by_year'] = year_counts
         
-        # By month
-        df_dates['month'] = df_dates['date'].dt.month
-        analysis['by_month'] = df_dates['month'].value_counts().to_dict()
+        month_counts = _bincount_dict(months)
+        analysis['by_month'] = month_counts
         
-        # By day of week
-        df_dates['dayofweek'] = df_dates['date'].dt.dayofweek
         dow_names = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
-        dow_counts = df_dates['dayofweek'].value_counts()
+        dow_counts = _bincount_dict(dayofweek)
         analysis['by_day_of_week'] = {dow_names[k]: v for k, v in dow_counts.items()}
         
         # By hour (if time information available)
-        df_dates['hour'] = df_dates['date'].dt.hour
-        analysis['by_hour'] = df_dates['hour'].value_counts().to_dict()
+        analysis['by_hour'] = _bincount_dict(hours)
         
-        # Most active periods
-        analysis['most_active_year'] = int(df_dates['year'].mode().iloc[0]) if len(df_dates) > 0 else None
-        analysis['most_active_month'] = int(df_dates['month'].mode().iloc[0]) if len(df_dates) > 0 else None
-        analysis['most_active_day'] = dow_names[int(df_dates['dayofweek'].mode().iloc[0])] if len(df_dates) > 0 else None
+        # Most active periods (keys are ascending, so max() keeps the smallest value on ties, like Series.mode)
+        analysis['most_active_year'] = max(year_counts, key=year_counts.get)
+        analysis['most_active_month'] = max(month_counts, key=month_counts.get)
+        analysis['most_active_day'] = dow_names[max(dow_counts, key=dow_counts.get)]
         
         return analysis
     
@@ -186,32 +358,46 @@ class StatisticalAnalyzer:
             return {}
         
         # Filter to numeric fields that exist
-        valid_fields = [f for f in fields if f in self.data.columns and pd.api.types.is_numeric_dtype(self.data[f])]
+        valid_fields = [f for f in fields if self._numeric_values(f) is not None]
         
         if len(valid_fields) < 2:
             return {'error': 'Need at least 2 numeric fields'}
         
         # Calculate correlation matrix
-        corr_matrix = self.data[valid_fields].corr()
+        arr = self.data[valid_fields].to_numpy(dtype=np.float64)
+        if np.isnan(arr).any():
+            # Missing values need pandas' pairwise-complete handling
+            corr = self.data[valid_fields].corr().to_numpy()
+        else:
+            with np.errstate(divide='ignore', invalid='ignore'):
+                corr = np.corrcoef(arr, rowvar=False)
+        corr_matrix = pd.DataFrame(corr, index=valid_fields, columns=valid_fields)
         
         # Convert to dict format
         result = {
             'fields': valid_fields,
-            'matrix': corr_matrix.to_dict(),
-            'pairs': []
+            'matrix': corr_matrix.to_dict()
         }
         
-        # Extract significant correlations (|r| > 0.5)
-        for i, field1 in enumerate(valid_fields):
-            for field2 in valid_fields[i+1:]:
-                corr_value = corr_matrix.loc[field1, field2]
-                if abs(corr_value) > 0.5:
-                    result['pairs'].append({
-                        'field1': field1,
-                        'field2': field2,
-                        'correlation': float(corr_value),
-                        'strength': 'strong' if abs(corr_value) > 0.7 else 'moderate'
-                    })
+        # Extract significant correlations (|r| > 0.5) from the upper triangle
+        rows, cols = np.triu_indices(len(valid_fields), k=1)
+        values = corr[rows, cols]
+        significant = np.abs(values) > 0.5
+        values = values[significant]
+        result['pairs'] = [
+            {
+                'field1': valid_fields[i],
+                'field2': valid_fields[j],
+                'correlation': value,
+                'strength': 'strong' if strong else 'moderate'
+            }
+            for i, j, value, strong in zip(
+                rows[significant].tolist(),
+                cols[significant].tolist(),
+                values.tolist(),
+                (np.abs(values) > 0.7).tolist()
+            )
+        ]
         
         return result
     
@@ -232,17 +418,21 @@ class StatisticalAnalyzer:
         Returns:
             Dictionary with grouped results
         """
-        if self.data is None or group_by not in self.data.columns:
+        if group_by not in self._columns:
             return {}
         
         # Filter valid aggregate fields
-        valid_fields = [f for f in aggregate_fields if f in self.data.columns]
+        valid_fields = [f for f in aggregate_fields if f in self._columns]
         
         if not valid_fields:
             return {}
         
         # Perform groupby operation
-        grouped = self.data.groupby(group_by)[valid_fields].agg(agg_func)
+        grouped = self.data.groupby(group_by, observed=True)[valid_fields]
+        if agg_func in self.GROUPBY_METHODS:
+            grouped = getattr(grouped, agg_func)()
+        else:
+            grouped = grouped.agg(agg_func)
         
         return {
             'group_by': group_by,
@@ -267,26 +457,17 @@ class StatisticalAnalyzer:
         Returns:
             Dictionary with outlier information
         """
-        if self.data is None or field not in self.data.columns:
-            return {}
+        numeric = self._numeric_values(field)
         
-        series = self.data[field].dropna()
-        
-        if len(series) == 0 or not pd.api.types.is_numeric_dtype(series):
+        if numeric is None or len(numeric[1]) == 0:
             return {}
         
-        outliers = []
+        values, arr = numeric
         
         if method == 'iqr':
             # Interquartile Range method
-            q1 = series.quantile(0.25)
-            q3 = series.quantile(0.75)
-            iqr = q3 - q1
-            lower_bound = q1 - threshold * iqr
-            upper_bound = q3 + threshold * iqr
-            
-            outlier_mask = (series < lower_bound) | (series > upper_bound)
-            outliers = series[outlier_mask].tolist()
+            outlier_mask, lower_bound, upper_bound = _iqr_outliers(arr, threshold)
+            outliers = values[outlier_mask]
             
             result = {
                 'method': 'iqr',
@@ -296,18 +477,15 @@ class StatisticalAnalyzer:
                     'upper': float(upper_bound)
                 },
                 'outlier_count': len(outliers),
-                'outlier_percentage': (len(outliers) / len(series)) * 100,
-                'outliers': outliers[:100]  # Limit to 100
+                'outlier_percentage': (len(outliers) / len(arr)) * 100,
+                'outliers': outliers[:100].tolist()  # Limit to 100
             }
             
         elif method == 'zscore':
             # Z-score method
-            mean = series.mean()
-            std = series.std()
-            z_scores = np.abs((series - mean) / std)
-            
-            outlier_mask = z_scores > threshold
-            outliers = series[outlier_mask].tolist()
+            with np.errstate(divide='ignore', invalid='ignore'):
+                outlier_mask, mean, std = _zscore_outliers(arr, threshold)
+            outliers = values[outlier_mask]
             
             result = {
                 'method': 'zscore',
@@ -315,18 +493,15 @@ class StatisticalAnalyzer:
                 'mean': float(mean),
                 'std': float(std),
                 'outlier_count': len(outliers),
-                'outlier_percentage': (len(outliers) / len(series)) * 100,
-                'outliers': outliers[:100]
+                'outlier_percentage': (len(outliers) / len(arr)) * 100,
+                'outliers': outliers[:100].tolist()
             }
         
         elif method == 'modified_zscore':
             # Modified Z-score (more robust)
-            median = series.median()
-            mad = np.median(np.abs(series - median))
-            modified_z_scores = 0.6745 * (series - median) / mad
-            
-            outlier_mask = np.abs(modified_z_scores) > threshold
-            outliers = series[outlier_mask].tolist()
+            with np.errstate(divide='ignore', invalid='ignore'):
+                outlier_mask, median, mad = _mad_outliers(arr, threshold)
+            outliers = values[outlier_mask]
             
             result = {
                 'method': 'modified_zscore',
@@ -334,8 +509,8 @@ class StatisticalAnalyzer:
                 'median': float(median),
                 'mad': float(mad),
                 'outlier_count': len(outliers),
-                'outlier_percentage': (len(outliers) / len(series)) * 100,
-                'outliers': outliers[:100]
+                'outlier_percentage': (len(outliers) / len(arr)) * 100,
+                'outliers': outliers[:100].tolist()
             }
         
         else:
@@ -351,116 +526,128 @@ class StatisticalAnalyzer:
         analysis = {}
         
         # Camera distribution
-        if 'camera_model' in self.data.columns:
+        if 'camera_model' in self._columns:
             camera_counts = self.data['camera_model'].value_counts()
             analysis['camera_distribution'] = camera_counts.head(10).to_dict()
             analysis['unique_cameras'] = int(camera_counts.count())
             analysis['most_used_camera'] = camera_counts.index[0] if len(camera_counts) > 0 else None
         
         # Lens distribution
-        if 'lens_model' in self.data.columns:
+        if 'lens_model' in self._columns:
             lens_counts = self.data['lens_model'].value_counts()
             analysis['lens_distribution'] = lens_counts.head(10).to_dict()
         
         # Camera settings analysis
-        if 'iso' in self.data.columns:
+        if 'iso' in self._columns:
             analysis['iso_stats'] = self.calculate_descriptive_stats('iso')
         
-        if 'aperture' in self.data.columns:
+        if 'aperture' in self._columns:
             analysis['aperture_stats'] = self.calculate_descriptive_stats('aperture')
         
-        if 'focal_length' in self.data.columns:
+        if 'focal_length' in self._columns:
             analysis['focal_length_stats'] = self.calculate_descriptive_stats('focal_length')
         
         return analysis
     
     def resolution_analysis(self) -> Dict[str, Any]:
         """Analyze image/video resolution patterns."""
-        if self.data is None:
+        if 'width' not in self._columns or 'height' not in self._columns:
             return {}
         
         analysis = {}
         
-        if 'width' in self.data.columns and 'height' in self.data.columns:
-            # Create resolution strings
-            resolutions = self.data.apply(
-                lambda row: f"{int(row['width'])}x{int(row['height'])}" 
-                if pd.notna(row['width']) and pd.notna(row['height']) else None,
-                axis=1
-            ).dropna()
+        # Count (width, height) integer pairs; rows missing either dimension are skipped
+        mask = self.data['width'].notna() & self.data['height'].notna()
+        widths = self.data.loc[mask, 'width'].to_numpy(dtype=np.int64)
+        heights = self.data.loc[mask, 'height'].to_numpy(dtype=np.int64)
+        
+        if len(widths) > 0:
+            pairs = pd.DataFrame({'width': widths, 'height': heights})
+            res_counts = pairs.groupby(['width', 'height']).size().sort_values(ascending=False, kind='stable')
             
-            if len(resolutions) > 0:
-                res_counts = resolutions.value_counts()
-                analysis['resolution_distribution'] = res_counts.head(10).to_dict()
-                analysis['most_common_resolution'] = res_counts.index[0] if len(res_counts) > 0 else None
+            # Only the reported top 10 are formatted as "WxH" strings
+            analysis['resolution_distribution'] = {
+                f"{w}x{h}": int(count) for (w, h), count in res_counts.head(10).items()
+            }
+            analysis['most_common_resolution'] = next(iter(analysis['resolution_distribution']))
             
             # Calculate megapixels
-            megapixels = (self.data['width'] * self.data['height'] / 1_000_000).dropna()
-            if len(megapixels) > 0:
-                analysis['megapixels_stats'] = {
-                    'mean': float(megapixels.mean()),
-                    'median': float(megapixels.median()),
-                    'min': float(megapixels.min()),
-                    'max': float(megapixels.max())
-                }
+            megapixels = widths * heights / 1_000_000
+            mp_min, mp_median, mp_max = np.percentile(megapixels, [0, 50, 100])
+            analysis['megapixels_stats'] = {
+                'mean': float(megapixels.mean()),
+                'median': float(mp_median),
+                'min': float(mp_min),
+                'max': float(mp_max)
+            }
         
         return analysis
     
     def gps_analysis(self) -> Dict[str, Any]:
         """Analyze GPS location patterns."""
-        if self.data is None:
+        if 'gps_latitude' not in self._columns or 'gps_longitude' not in self._columns:
             return {}
         
         analysis = {}
         
-        if 'gps_latitude' in self.data.columns and 'gps_longitude' in self.data.columns:
-            gps_data = self.data[['gps_latitude', 'gps_longitude']].dropna()
-            
-            analysis['files_with_gps'] = len(gps_data)
-            analysis['gps_percentage'] = (len(gps_data) / len(self.data)) * 100
+        gps = self.data[['gps_latitude', 'gps_longitude']].to_numpy(dtype=np.float64)
+        gps = gps[~np.isnan(gps).any(axis=1)]
+        
+        analysis['files_with_gps'] = len(gps)
+        analysis['gps_percentage'] = (len(gps) / len(self.data)) * 100
+        
+        if len(gps) > 0:
+            mins, maxs, means = gps.min(axis=0), gps.max(axis=0), gps.mean(axis=0)
+            analysis['latitude_range'] = {
+                'min': float(mins[0]),
+                'max': float(maxs[0])
+            }
+            analysis['longitude_range'] = {
+                'min': float(mins[1]),
+                'max': float(maxs[1])
+            }
             
-            if len(gps_data) > 0:
-                analysis['latitude_range'] = {
-                    'min': float(gps_data['gps_latitude'].min()),
-                    'max': float(gps_data['gps_latitude'].max())
-                }
-                analysis['longitude_range'] = {
-                    'min': float(gps_data['gps_longitude'].min()),
-                    'max': float(gps_data['gps_longitude'].max())
-                }
-                
-                # Approximate center point
-                analysis['center_point'] = {
-                    'latitude': float(gps_data['gps_latitude'].mean()),
-                    'longitude': float(gps_data['gps_longitude'].mean())
-                }
+            # Approximate center point
+            analysis['center_point'] = {
+                'latitude': float(means[0]),
+                'longitude': float(means[1])
+            }
         
         return analysis
     
     def file_size_analysis(self) -> Dict[str, Any]:
         """Analyze file size patterns."""
-        if self.data is None or 'file_size' not in self.data.columns:
+        if 'file_size' not in self._columns:
             return {}
         
-        # Convert to MB
-        file_sizes_mb = self.data['file_size'] / (1024 * 1024)
+        # Work on the raw byte counts and scale the scalar results to MB
+        raw = self.data['file_size'].dropna().to_numpy(dtype=np.int64)
+        mb = 1024 * 1024
+        total = int(raw.sum())
+        
+        if len(raw) > 0:
+            size_min, size_median, size_max = np.percentile(raw, [0, 50, 100]) / mb
+            size_mean = total / len(raw) / mb
+        else:
+            size_min = size_median = size_max = size_mean = float('nan')
+        size_std = raw.std(ddof=1) / mb if len(raw) > 1 else float('nan')
         
         analysis = {
-            'total_size_gb': float(file_sizes_mb.sum() / 1024),
+            'total_size_gb': total / mb / 1024,
             'size_stats_mb': {
-                'mean': float(file_sizes_mb.mean()),
-                'median': float(file_sizes_mb.median()),
-                'min': float(file_sizes_mb.min()),
-                'max': float(file_sizes_mb.max()),
-                'std': float(file_sizes_mb.std())
+                'mean': float(size_mean),
+                'median': float(size_median),
+                'min': float(size_min),
+                'max': float(size_max),
+                'std': float(size_std)
             }
         }
         
-        # Size distribution by ranges
-        bins = [0, 1, 5, 10, 50, 100, float('inf')]
+        # Size distribution by ranges (right-inclusive bins, zero-byte files are not counted)
+        edges = np.array([0, 1, 5, 10, 50, 100]) * mb
         labels = ['<1MB', '1-5MB', '5-10MB', '10-50MB', '50-100MB', '>100MB']
-        size_categories = pd.cut(file_sizes_mb, bins=bins, labels=labels)
-        analysis['size_distribution'] = size_categories.value_counts().to_dict()
+        counts = np.bincount(np.digitize(raw, edges, right=True), minlength=len(labels) + 1)
+        analysis['size_distribution'] = dict(zip(labels, counts[1:].tolist()))
         
         return analysis
     
@@ -480,32 +667,134 @@ class StatisticalAnalyzer:
             'overview': {}
         }
         
+        # Column aggregations planned and executed together when polars is available
+        sections = self._polars_summary() if POLARS_AVAILABLE else {}
+        
         # File type distribution
-        if 'file_type' in self.data.columns:
-            report['overview']['file_type_distribution'] = self.data['file_type'].value_counts().to_dict()
+        if 'file_type' in self._columns:
+            report['overview']['file_type_distribution'] = (
+                sections.get('file_type_distribution') or self.data['file_type'].value_counts().to_dict()
+            )
         
         # Temporal analysis
-        if 'created_date' in self.data.columns:
+        if 'created_date' in self._columns:
             report['temporal_analysis'] = self.temporal_analysis('created_date')
         
         # Camera analysis (for images)
-        if 'camera_model' in self.data.columns:
+        if 'camera_model' in self._columns:
             report['camera_analysis'] = self.camera_analysis()
         
         # Resolution analysis
-        if 'width' in self.data.columns:
+        if 'width' in self._columns:
             report['resolution_analysis'] = self.resolution_analysis()
         
         # GPS analysis
-        if 'gps_latitude' in self.data.columns:
-            report['gps_analysis'] = self.gps_analysis()
+        if 'gps_latitude' in self._columns:
+            report['gps_analysis'] = sections.get('gps_analysis') or self.gps_analysis()
         
         # File size analysis
-        if 'file_size' in self.data.columns:
-            report['file_size_analysis'] = self.file_size_analysis()
+        if 'file_size' in self._columns:
+            report['file_size_analysis'] = sections.get('file_size_analysis') or self.file_size_analysis()
         
         return report
     
+    def _polars_summary(self) -> Dict[str, Any]:
+        """
+        Compute the aggregation-only report sections with one polars lazy plan.
+        
+        Only the columns these sections use are converted, and the queries run
+        through a single collect_all so polars can share the scan between them.
+        
+        Returns:
+            Dictionary with any of 'file_type_distribution', 'gps_analysis' and
+            'file_size_analysis'; empty if polars cannot handle the data
+        """
+        columns = [c for c in ('file_type', 'file_size', 'gps_latitude', 'gps_longitude')
+                   if c in self._columns]
+        if not columns:
+            return {}
+        
+        try:
+            # Aggregate at 64 bits even if the frame was downcast, so sums cannot wrap
+            lf = pl.from_pandas(self.data[columns]).lazy().with_columns(
+                pl.col(pl.Int8, pl.Int16, pl.Int32).cast(pl.Int64),
+                pl.col(pl.Float32).cast(pl.Float64),
+            )
+            queries = {}
+            
+            if 'file_type' in columns:
+                queries['file_type'] = (
+                    lf.filter(pl.col('file_type').is_not_null())
+                    .group_by('file_type')
+                    .agg(pl.len().alias('count'))
+                    .sort('count', descending=True, maintain_order=True)
+                )
+            
+            if 'gps_latitude' in columns and 'gps_longitude' in columns:
+                lat, lon = pl.col('gps_latitude'), pl.col('gps_longitude')
+                queries['gps'] = (
+                    lf.filter(lat.is_not_null() & lon.is_not_null())
+                    .select(
+                        pl.len().alias('count'),
+                        lat.min().alias('lat_min'), lat.max().alias('lat_max'), lat.mean().alias('lat_mean'),
+                        lon.min().alias('lon_min'), lon.max().alias('lon_max'), lon.mean().alias('lon_mean'),
+                    )
+                )
+            
+            if 'file_size' in columns:
+                mb = 1024 * 1024
+                size = pl.col('file_size')
+                sizes = lf.filter(size.is_not_null())
+                queries['size_stats'] = sizes.select(
+                    size.sum().alias('total'), size.mean().alias('mean'), size.median().alias('median'),
+                    size.min().alias('min'), size.max().alias('max'), size.std().alias('std'),
+                )
+                # Bucket index counts how many (right-inclusive) edges a size exceeds
+                bucket = pl.sum_horizontal([(size > edge * mb).cast(pl.Int8) for edge in (0, 1, 5, 10, 50, 100)])
+                queries['size_buckets'] = sizes.group_by(bucket.alias('bucket')).agg(pl.len().alias('count'))
+            
+            frames = dict(zip(queries, pl.collect_all(list(queries.values()))))
+        except Exception:
+            return {}
+        
+        def _float(value):
+            return float('nan') if value is None else float(value)
+        
+        sections = {}
+        
+        if 'file_type' in frames:
+            counts = frames['file_type']
+            sections['file_type_distribution'] = dict(zip(counts['file_type'].to_list(), counts['count'].to_list()))
+        
+        if 'gps_latitude' in columns:
+            analysis = {}
+            if 'gps' in frames:
+                gps = frames['gps'].row(0, named=True)
+                analysis['files_with_gps'] = gps['count']
+                analysis['gps_percentage'] = (gps['count'] / len(self.data)) * 100
+                if gps['count'] > 0:
+                    analysis['latitude_range'] = {'min': float(gps['lat_min']), 'max': float(gps['lat_max'])}
+                    analysis['longitude_range'] = {'min': float(gps['lon_min']), 'max': float(gps['lon_max'])}
+                    analysis['center_point'] = {
+                        'latitude': float(gps['lat_mean']),
+                        'longitude': float(gps['lon_mean'])
+                    }
+            sections['gps_analysis'] = analysis
+        
+        if 'size_stats' in frames:
+            size_stats = frames['size_stats'].row(0, named=True)
+            labels = ['<1MB', '1-5MB', '5-10MB', '10-50MB', '50-100MB', '>100MB']
+            buckets = dict(zip(frames['size_buckets']['bucket'].to_list(), frames['size_buckets']['count'].to_list()))
+            sections['file_size_analysis'] = {
+                'total_size_gb': (size_stats['total'] or 0) / mb / 1024,
+                'size_stats_mb': {
+                    key: _float(size_stats[key]) / mb for key in ('mean', 'median', 'min', 'max', 'std')
+                },
+                'size_distribution': {label: buckets.get(i + 1, 0) for i, label in enumerate(labels)}
+            }
+        
+        return sections
+    
     def export_report(self, output_path: str, format: str = 'json'):
         """
         Export analysis report to file.
@@ -517,8 +806,13 @@ class StatisticalAnalyzer:
         report = self.get_summary_report()
         
         if format == 'json':
-            with open(output_path, 'w') as f:
-                json.dump(report, f, indent=2, default=str)
+            if ORJSON_AVAILABLE:
+                options = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+                with open(output_path, 'wb') as f:
+                    f.write(orjson.dumps(report, default=str, option=options))
+            else:
+                with open(output_path, 'w') as f:
+                    json.dump(report, f, indent=2, default=str)
         elif format == 'txt':
             with open(output_path, 'w') as f:
                 self._write_report_text(f, report)
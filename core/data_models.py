@@ -2,9 +2,12 @@
 Data models for metadata storage and validation.
 """
 
+import os
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import cached_property
 from typing import Optional, Dict, Any, List
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, ConfigDict, Field
 from pathlib import Path
 
 
@@ -20,50 +23,66 @@ class FileMetadata(BaseModel):
     modified_date: Optional[datetime] = None
     processed_date: datetime = Field(default_factory=datetime.now)
     
-    @validator('file_path')
-    def validate_path(cls, v):
-        """Ensure file path exists."""
-        if not Path(v).exists():
-            raise ValueError(f"File does not exist: {v}")
-        return str(Path(v).resolve())
+    @classmethod
+    def from_path(cls, file_path: str, **fields: Any) -> "FileMetadata":
+        """
+        Create a model for a file on disk, storing its resolved path.
+        
+        The constructor itself does not touch the filesystem; use this when
+        the path still needs to be checked.
+        
+        Raises:
+            ValueError: If the file does not exist
+        """
+        try:
+            resolved = Path(file_path).resolve(strict=True)
+        except FileNotFoundError:
+            raise ValueError(f"File does not exist: {file_path}")
+        return cls(file_path=str(resolved), **fields)
+    
+    @staticmethod
+    def validate_paths_bulk(paths: List[str], max_workers: int = 32) -> Dict[str, bool]:
+        """
+        Check which of many paths exist, running the stat calls in parallel.
+        
+        Use this to prefilter a batch before constructing models directly,
+        instead of calling from_path once per file.
+        
+        Args:
+            paths: File paths to check
+            max_workers: Number of threads issuing stat calls
+        
+        Returns:
+            Dictionary mapping each path to whether it exists
+        """
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return dict(zip(paths, executor.map(os.path.exists, paths)))
     
     @property
     def file_size_mb(self) -> float:
         """Return file size in MB."""
         return self.file_size / (1024 * 1024)
-    
-    class Config:
-        json_encoders = {
-            datetime: lambda v: v.isoformat()
-        }
 
 
 class GPSCoordinates(BaseModel):
     """GPS coordinate data model."""
     
-    latitude: float
-    longitude: float
+    model_config = ConfigDict(frozen=True)
+    
+    latitude: float = Field(ge=-90, le=90)
+    longitude: float = Field(ge=-180, le=180)
     altitude: Optional[float] = None
     latitude_ref: Optional[str] = None  # N or S
     longitude_ref: Optional[str] = None  # E or W
     
-    @validator('latitude')
-    def validate_latitude(cls, v):
-        """Ensure latitude is valid."""
-        if not -90 <= v <= 90:
-            raise ValueError(f"Invalid latitude: {v}")
-        return v
-    
-    @validator('longitude')
-    def validate_longitude(cls, v):
-        """Ensure longitude is valid."""
-        if not -180 <= v <= 180:
-            raise ValueError(f"Invalid longitude: {v}")
-        return v
+    @cached_property
+    def maps_url(self) -> str:
+        """Google Maps URL (built once; the model is frozen)."""
+        return f"https://www.google.com/maps?q={self.latitude},{self.longitude}"
     
     def to_google_maps_url(self) -> str:
         """Generate Google Maps URL."""
-        return f"https://www.google.com/maps?q={self.latitude},{self.longitude}"
+        return self.maps_url
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary."""
@@ -71,7 +90,7 @@ class GPSCoordinates(BaseModel):
             "latitude": self.latitude,
             "longitude": self.longitude,
             "altitude": self.altitude,
-            "maps_url": self.to_google_maps_url()
+            "maps_url": self.maps_url
         }
 
 
@@ -193,11 +212,6 @@ class StatisticalSummary(BaseModel):
     files_with_gps: Optional[int] = None
     most_common_camera: Optional[str] = None
     most_common_resolution: Optional[str] = None
-    
-    class Config:
-        json_encoders = {
-            datetime: lambda v: v.isoformat()
-        }
 
 
 class BatchProcessResult(BaseModel):
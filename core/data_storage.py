@@ -8,10 +8,16 @@ and managing metadata in a SQLite database.
 
 import sqlite3
 import json
+import queue
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
 from pathlib import Path
-from typing import List, Dict, Any, Optional, Tuple
-from datetime import datetime
+from typing import List, Dict, Any, Optional, Tuple, Iterator
+from datetime import datetime, timedelta, timezone
 from contextlib import contextmanager
+from functools import lru_cache
 
 try:
     import pandas as pd
@@ -19,6 +25,227 @@ try:
 except ImportError:
     PANDAS_AVAILABLE = False
 
+try:
+    import adbc_driver_sqlite.dbapi as adbc_sqlite
+    import pyarrow as pa
+    from adbc_driver_sqlite import StatementOptions as _AdbcStatementOptions
+    _ADBC_BATCH_ROWS = _AdbcStatementOptions.BATCH_ROWS.value
+    ADBC_AVAILABLE = True
+except ImportError:
+    ADBC_AVAILABLE = False
+
+
+_EPOCH = datetime(1970, 1, 1)
+
+# Columns declared TIMESTAMP, per table; they hold integer seconds since the epoch
+_TIMESTAMP_COLUMNS_BY_TABLE = {
+    'files': ('created_date', 'modified_date', 'processed_date'),
+    'image_metadata': ('date_taken',),
+    'document_metadata': ('creation_date', 'modification_date'),
+}
+_TIMESTAMP_COLUMNS = frozenset(
+    column for columns in _TIMESTAMP_COLUMNS_BY_TABLE.values() for column in columns
+)
+
+# PRAGMA user_version once ISO text timestamps of older versions are converted
+_SCHEMA_VERSION = 2
+
+
+def _to_epoch(value):
+    """Convert a datetime to epoch seconds (naive values keep their wall-clock time); pass other values through."""
+    if not isinstance(value, datetime):
+        return value
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return (value - _EPOCH) // timedelta(seconds=1)
+
+
+def _db_values(metadata: Dict[str, Any], keys: Tuple[str, ...], epoch_positions: Tuple[int, ...]) -> list:
+    """Values of keys in metadata, with the TIMESTAMP ones at epoch_positions as epoch seconds."""
+    values = list(map(metadata.get, keys))
+    for i in epoch_positions:
+        values[i] = _to_epoch(values[i])
+    return values
+
+
+@lru_cache(maxsize=128)
+def _timestamp_positions(description: tuple) -> Tuple[int, ...]:
+    """Indexes of the TIMESTAMP columns in a cursor description."""
+    return tuple(i for i, column in enumerate(description) if column[0] in _TIMESTAMP_COLUMNS)
+
+
+def _row_factory(cursor: sqlite3.Cursor, row: tuple) -> sqlite3.Row:
+    """
+    Build a sqlite3.Row with TIMESTAMP columns read back as datetime.
+    
+    Set per connection instead of registering a module-wide sqlite3
+    converter, which would apply to every other sqlite3 user in the process.
+    """
+    positions = _timestamp_positions(cursor.description)
+    if positions:
+        row = list(row)
+        for i in positions:
+            if isinstance(row[i], int):
+                row[i] = _EPOCH + timedelta(seconds=row[i])
+        row = tuple(row)
+    return sqlite3.Row(cursor, row)
+
+
+# Applied to every new connection (journal_mode=WAL is persistent and set once)
+_CONNECTION_PRAGMAS = (
+    'PRAGMA synchronous=NORMAL',
+    'PRAGMA temp_store=MEMORY',
+    'PRAGMA cache_size=-64000',
+    'PRAGMA mmap_size=268435456',
+    'PRAGMA foreign_keys=ON',
+)
+
+# Metadata keys for each INSERT, in placeholder order after any file_id.
+# Rows are built with map(metadata.get, keys): one C-level pass per record.
+_FILE_KEYS = (
+    'file_path', 'file_name', 'file_type', 'file_size', 'mime_type',
+    'created_date', 'modified_date',
+)
+# NOT NULL columns of files; records missing one are rejected before inserting
+_REQUIRED_KEYS = ('file_path', 'file_name', 'file_type', 'file_size')
+_IMAGE_KEYS = (
+    'width', 'height', 'camera_make', 'camera_model', 'lens_model',
+    'focal_length', 'aperture', 'shutter_speed', 'iso', 'flash', 'orientation',
+    'color_space', 'date_taken', 'software', 'format',
+)
+_GPS_KEYS = ('latitude', 'longitude', 'altitude')
+_VIDEO_KEYS = (
+    'duration', 'width', 'height', 'codec', 'frame_rate', 'bitrate',
+    'audio_codec', 'audio_sample_rate', 'audio_channels',
+)
+_AUDIO_KEYS = (
+    'title', 'artist', 'album', 'album_artist', 'genre', 'year',
+    'track_number', 'duration', 'bitrate', 'sample_rate', 'channels', 'codec',
+)
+_DOCUMENT_KEYS = (
+    'title', 'author', 'subject', 'creator', 'producer',
+    'page_count', 'word_count', 'creation_date', 'modification_date',
+)
+
+# Positions of the TIMESTAMP keys in each key tuple, converted to epoch seconds when rows are built
+_FILE_EPOCHS, _IMAGE_EPOCHS, _DOCUMENT_EPOCHS = (
+    tuple(i for i, key in enumerate(keys) if key in _TIMESTAMP_COLUMNS)
+    for keys in (_FILE_KEYS, _IMAGE_KEYS, _DOCUMENT_KEYS)
+)
+
+# Re-ingesting a known path updates the row in place (REPLACE would delete it and cascade)
+_SQL_UPSERT_FILES = '''
+    INSERT INTO files
+    (file_path, file_name, file_type, file_size, mime_type, created_date, modified_date, processed_date)
+    VALUES (?, ?, ?, ?, ?, ?, ?, CAST(strftime('%s', 'now') AS INTEGER))
+    ON CONFLICT(file_path) DO UPDATE SET
+        file_name = excluded.file_name,
+        file_type = excluded.file_type,
+        file_size = excluded.file_size,
+        mime_type = excluded.mime_type,
+        created_date = excluded.created_date,
+        modified_date = excluded.modified_date,
+        processed_date = CAST(strftime('%s', 'now') AS INTEGER)
+'''
+
+_SQL_UPSERT_FILES_RETURNING_ID = _SQL_UPSERT_FILES + '    RETURNING id\n'
+
+# Type-specific rows carry the file path; this subquery resolves it to files.id,
+# so the rows can be built before the files rows are written
+_FILE_ID_BY_PATH = '(SELECT id FROM files WHERE file_path = ?)'
+
+_SQL_INSERT_IMAGE = f'''
+    INSERT OR REPLACE INTO image_metadata
+    (file_id, width, height, camera_make, camera_model, lens_model,
+     focal_length, aperture, shutter_speed, iso, flash, orientation,
+     color_space, date_taken, software, format,
+     gps_latitude, gps_longitude, gps_altitude)
+    VALUES ({_FILE_ID_BY_PATH}, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+'''
+
+_SQL_INSERT_VIDEO = f'''
+    INSERT OR REPLACE INTO video_metadata
+    (file_id, duration, width, height, codec, frame_rate, bitrate,
+     audio_codec, audio_sample_rate, audio_channels)
+    VALUES ({_FILE_ID_BY_PATH}, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+'''
+
+_SQL_INSERT_AUDIO = f'''
+    INSERT OR REPLACE INTO audio_metadata
+    (file_id, title, artist, album, album_artist, genre, year,
+     track_number, duration, bitrate, sample_rate, channels, codec)
+    VALUES ({_FILE_ID_BY_PATH}, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+'''
+
+_SQL_INSERT_DOCUMENT = f'''
+    INSERT OR REPLACE INTO document_metadata
+    (file_id, title, author, subject, creator, producer,
+     page_count, word_count, creation_date, modification_date, keywords)
+    VALUES ({_FILE_ID_BY_PATH}, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+'''
+
+# json_each expands a JSON keyword list into one row per keyword
+_SQL_INSERT_KEYWORDS = f'''
+    INSERT INTO document_keywords (file_id, keyword)
+    SELECT {_FILE_ID_BY_PATH}, value FROM json_each(?)
+'''
+
+# Clears rows left by an earlier ingest of the same path before new ones go in
+_SQL_DELETE_TYPE_METADATA = tuple(
+    f"DELETE FROM {table} WHERE file_id = {_FILE_ID_BY_PATH}"
+    for table in (
+        'image_metadata', 'video_metadata', 'audio_metadata',
+        'document_metadata', 'document_keywords',
+    )
+)
+
+_SQL_INSERT_FIELD = '''
+    INSERT INTO metadata_fields (file_id, field_name, field_value)
+    VALUES (?, ?, ?)
+'''
+
+# query_files accepts ORDER BY on these columns; one precompiled query per variant
+_FILES_ORDER_COLUMNS = (
+    'id', 'file_path', 'file_name', 'file_type', 'file_size', 'mime_type',
+    'created_date', 'modified_date', 'processed_date',
+)
+
+_SQL_QUERY_FILES = {
+    (f"{column} {direction}", filtered): (
+        "SELECT * FROM files"
+        + (" WHERE file_type = ?" if filtered else "")
+        + f" ORDER BY {column} {direction} LIMIT ? OFFSET ?"
+    )
+    for column in _FILES_ORDER_COLUMNS
+    for direction in ('ASC', 'DESC')
+    for filtered in (False, True)
+}
+
+# Keyset pages for query_files_iter, keyed by whether file_type is filtered
+_SQL_ITER_FILES = {
+    False: "SELECT * FROM files WHERE id > ? ORDER BY id LIMIT ?",
+    True: "SELECT * FROM files WHERE file_type = ? AND id > ? ORDER BY id LIMIT ?",
+}
+
+# Type-specific metadata tables, in the order _SQL_FILE_BY_ID joins them
+_METADATA_TABLES = {
+    'image': 'image_metadata',
+    'video': 'video_metadata',
+    'audio': 'audio_metadata',
+    'document': 'document_metadata',
+}
+
+# Only the table matching the file's type can produce a non-NULL join
+_SQL_FILE_BY_ID = '''
+    SELECT f.*, i.*, v.*, a.*, d.*
+    FROM files f
+    LEFT JOIN image_metadata i ON i.file_id = f.id AND f.file_type = 'image'
+    LEFT JOIN video_metadata v ON v.file_id = f.id AND f.file_type = 'video'
+    LEFT JOIN audio_metadata a ON a.file_id = f.id AND f.file_type = 'audio'
+    LEFT JOIN document_metadata d ON d.file_id = f.id AND f.file_type = 'document'
+    WHERE f.id = ?
+'''
+
 
 class MetadataDatabase:
     """
@@ -28,26 +255,90 @@ class MetadataDatabase:
     different file types (images, videos, audio, documents).
     """
     
-    def __init__(self, db_path: str = "data/metadata.db"):
+    def __init__(self, db_path: str = "data/metadata.db", pool_size: int = 4):
         """
         Initialize database connection.
         
         Args:
             db_path: Path to SQLite database file
+            pool_size: Number of read-only connections kept open
         """
         self.db_path = db_path
+        self.errors: List[Dict[str, str]] = []
+        self._read_uri = Path(db_path).resolve().as_uri() + '?mode=ro'
         
         # Ensure directory exists
         Path(db_path).parent.mkdir(parents=True, exist_ok=True)
         
+        # One read-write connection (SQLite allows a single writer at a time)
+        self._write_pool = queue.Queue()
+        self._write_pool.put(self._connect())
+        # Writer connection held by bulk_transaction, per thread
+        self._bulk = threading.local()
+        
         # Initialize database
         self._create_tables()
+        
+        # WAL lets readers run alongside a writer; the mode is stored in the file
+        with self.get_connection() as conn:
+            conn.execute('PRAGMA journal_mode=WAL')
+            
+            # Column counts let get_file_by_id split its joined row per table
+            self._column_counts = {
+                table: len(conn.execute(f"PRAGMA table_info({table})").fetchall())
+                for table in ('files', *_METADATA_TABLES.values())
+            }
+        
+        self._read_pool = queue.Queue()
+        for _ in range(max(pool_size, 1)):
+            self._read_pool.put(self._connect(read_only=True))
+    
+    def _connect(self, read_only: bool = False) -> sqlite3.Connection:
+        """Open a connection with the standard PRAGMAs applied."""
+        if read_only:
+            conn = sqlite3.connect(
+                self._read_uri, uri=True, isolation_level=None,
+                check_same_thread=False, cached_statements=256
+            )
+        else:
+            conn = sqlite3.connect(
+                self.db_path, isolation_level=None,
+                check_same_thread=False, cached_statements=256
+            )
+        conn.row_factory = _row_factory  # Dict-like access, TIMESTAMP columns as datetime
+        for pragma in _CONNECTION_PRAGMAS:
+            conn.execute(pragma)
+        return conn
     
     @contextmanager
-    def get_connection(self):
-        """Context manager for database connections."""
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row  # Enable dict-like access
+    def get_connection(self, read_only: bool = False):
+        """
+        Context manager for pooled database connections.
+        
+        Connections are in autocommit mode; methods that write open their
+        own transaction with BEGIN, which is committed on exit. Connections
+        stay open and are returned to the pool afterwards.
+        
+        Inside bulk_transaction, write connections are the one it holds and
+        each block runs in a savepoint of the outer transaction instead.
+        
+        Args:
+            read_only: Borrow one of the read-only connections
+        """
+        bulk_conn = None if read_only else getattr(self._bulk, 'conn', None)
+        if bulk_conn is not None:
+            bulk_conn.execute('SAVEPOINT bulk_write')
+            try:
+                yield bulk_conn
+                bulk_conn.execute('RELEASE bulk_write')
+            except Exception as e:
+                bulk_conn.execute('ROLLBACK TO bulk_write')
+                bulk_conn.execute('RELEASE bulk_write')
+                raise e
+            return
+        
+        pool = self._read_pool if read_only else self._write_pool
+        conn = pool.get()
         try:
             yield conn
             conn.commit()
@@ -55,13 +346,56 @@ class MetadataDatabase:
             conn.rollback()
             raise e
         finally:
-            conn.close()
+            pool.put(conn)
+    
+    @contextmanager
+    def bulk_transaction(self):
+        """
+        Context manager running several write calls in one transaction.
+        
+        Holds the writer connection and opens BEGIN IMMEDIATE, so e.g.
+        delete_all followed by insert_batch commits (and syncs) once on
+        exit and is rolled back as a whole on error. Read-only connections
+        do not see the changes until the block exits.
+        """
+        conn = self._write_pool.get()
+        try:
+            conn.execute('BEGIN IMMEDIATE')
+            self._bulk.conn = conn
+            yield
+            conn.commit()
+        except Exception as e:
+            conn.rollback()
+            raise e
+        finally:
+            self._bulk.conn = None
+            self._write_pool.put(conn)
+    
+    @staticmethod
+    def _begin(cursor):
+        """Open a write transaction unless one (e.g. bulk_transaction) is already open."""
+        if not cursor.connection.in_transaction:
+            cursor.execute('BEGIN IMMEDIATE')
+    
+    def close(self):
+        """Run PRAGMA optimize and close all pooled connections."""
+        if not self._write_pool.empty():
+            self.optimize()
+        for pool in (self._write_pool, self._read_pool):
+            while not pool.empty():
+                pool.get_nowait().close()
     
     def _create_tables(self):
         """Create database tables if they don't exist."""
         with self.get_connection() as conn:
             cursor = conn.cursor()
             
+            # Only takes effect on a new database, before any table exists
+            cursor.execute('PRAGMA auto_vacuum=INCREMENTAL')
+            cursor.execute('BEGIN IMMEDIATE')
+            
+            legacy_tables = self._rename_legacy_tables(cursor)
+            
             # Files table (base information for all files)
             cursor.execute('''
                 CREATE TABLE IF NOT EXISTS files (
@@ -73,7 +407,7 @@ class MetadataDatabase:
                     mime_type TEXT,
                     created_date TIMESTAMP,
                     modified_date TIMESTAMP,
-                    processed_date TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    processed_date TIMESTAMP DEFAULT (CAST(strftime('%s', 'now') AS INTEGER)),
                     UNIQUE(file_path)
                 )
             ''')
@@ -81,8 +415,7 @@ class MetadataDatabase:
             # Image metadata table
             cursor.execute('''
                 CREATE TABLE IF NOT EXISTS image_metadata (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    file_id INTEGER NOT NULL,
+                    file_id INTEGER PRIMARY KEY,
                     width INTEGER,
                     height INTEGER,
                     camera_make TEXT,
@@ -108,8 +441,7 @@ class MetadataDatabase:
             # Video metadata table
             cursor.execute('''
                 CREATE TABLE IF NOT EXISTS video_metadata (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    file_id INTEGER NOT NULL,
+                    file_id INTEGER PRIMARY KEY,
                     duration REAL,
                     width INTEGER,
                     height INTEGER,
@@ -126,8 +458,7 @@ class MetadataDatabase:
             # Audio metadata table
             cursor.execute('''
                 CREATE TABLE IF NOT EXISTS audio_metadata (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    file_id INTEGER NOT NULL,
+                    file_id INTEGER PRIMARY KEY,
                     title TEXT,
                     artist TEXT,
                     album TEXT,
@@ -147,8 +478,7 @@ class MetadataDatabase:
             # Document metadata table
             cursor.execute('''
                 CREATE TABLE IF NOT EXISTS document_metadata (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    file_id INTEGER NOT NULL,
+                    file_id INTEGER PRIMARY KEY,
                     title TEXT,
                     author TEXT,
                     subject TEXT,
@@ -163,6 +493,15 @@ class MetadataDatabase:
                 )
             ''')
             
+            # Document keywords, one row per keyword (expanded from the JSON list)
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS document_keywords (
+                    file_id INTEGER NOT NULL,
+                    keyword TEXT NOT NULL,
+                    FOREIGN KEY (file_id) REFERENCES files(id) ON DELETE CASCADE
+                )
+            ''')
+            
             # Generic metadata fields (key-value pairs)
             cursor.execute('''
                 CREATE TABLE IF NOT EXISTS metadata_fields (
@@ -174,15 +513,97 @@ class MetadataDatabase:
                 )
             ''')
             
+            # Copy rows out of pre-migration tables (the newest row per file wins)
+            for table in legacy_tables:
+                columns = ', '.join(row[1] for row in cursor.execute(f"PRAGMA table_info({table})").fetchall())
+                cursor.execute(f'''
+                    INSERT OR REPLACE INTO {table} ({columns})
+                    SELECT {columns} FROM {table}_legacy
+                    WHERE file_id IN (SELECT id FROM files)
+                    ORDER BY id
+                ''')
+                cursor.execute(f"DROP TABLE {table}_legacy")
+            
+            schema_version = cursor.execute('PRAGMA user_version').fetchone()[0]
+            
+            # Older versions stored timestamps as ISO text; convert them to epoch seconds once
+            if schema_version < 1:
+                for table, columns in _TIMESTAMP_COLUMNS_BY_TABLE.items():
+                    for column in columns:
+                        cursor.execute(f'''
+                            UPDATE {table}
+                            SET {column} = CAST(strftime('%s', {column}) AS INTEGER)
+                            WHERE typeof({column}) = 'text' AND strftime('%s', {column}) IS NOT NULL
+                        ''')
+            
+            # Older versions stored document keywords comma-joined; rewrite them as
+            # JSON lists and expand them into document_keywords once
+            if schema_version < 2:
+                legacy_keywords = cursor.execute('''
+                    SELECT file_id, keywords FROM document_metadata
+                    WHERE typeof(keywords) = 'text'
+                    AND CASE WHEN json_valid(keywords) THEN json_type(keywords) != 'array' ELSE 1 END
+                ''').fetchall()
+                keyword_rows = [
+                    (file_id, json.dumps(keywords.split(',') if keywords else []))
+                    for file_id, keywords in legacy_keywords
+                ]
+                cursor.executemany(
+                    'UPDATE document_metadata SET keywords = ? WHERE file_id = ?',
+                    [(keywords, file_id) for file_id, keywords in keyword_rows]
+                )
+                cursor.executemany(
+                    'INSERT INTO document_keywords (file_id, keyword) SELECT ?, value FROM json_each(?)',
+                    keyword_rows
+                )
+            
+            if schema_version < _SCHEMA_VERSION:
+                cursor.execute(f'PRAGMA user_version = {_SCHEMA_VERSION}')
+            
             # Create indexes for better query performance
             cursor.execute('CREATE INDEX IF NOT EXISTS idx_files_type ON files(file_type)')
             cursor.execute('CREATE INDEX IF NOT EXISTS idx_files_created ON files(created_date)')
             cursor.execute('CREATE INDEX IF NOT EXISTS idx_image_camera ON image_metadata(camera_model)')
             cursor.execute('CREATE INDEX IF NOT EXISTS idx_image_gps ON image_metadata(gps_latitude, gps_longitude)')
             cursor.execute('CREATE INDEX IF NOT EXISTS idx_audio_artist ON audio_metadata(artist)')
+            cursor.execute('CREATE INDEX IF NOT EXISTS idx_audio_album ON audio_metadata(album)')
+            cursor.execute('CREATE INDEX IF NOT EXISTS idx_document_keyword ON document_keywords(keyword, file_id)')
+            
+            # Type-specific tables are keyed by file_id already; keywords need an index
+            cursor.execute('CREATE INDEX IF NOT EXISTS idx_keywords_file ON document_keywords(file_id)')
+            
+            # Key-value lookups by file and by field name/value
+            cursor.execute('CREATE INDEX IF NOT EXISTS idx_fields_file_name ON metadata_fields(file_id, field_name)')
+            cursor.execute('CREATE INDEX IF NOT EXISTS idx_fields_name_value ON metadata_fields(field_name, field_value)')
+            
+            # Partial covering index: get_files_with_gps reads only geotagged rows from it
+            cursor.execute('''
+                CREATE INDEX IF NOT EXISTS idx_image_gps_cover
+                ON image_metadata(file_id, gps_latitude, gps_longitude, gps_altitude)
+                WHERE gps_latitude IS NOT NULL
+            ''')
+            
+            # Refresh planner statistics (sampled, so this stays cheap on large databases)
+            cursor.execute('PRAGMA analysis_limit=1000')
+            cursor.execute('ANALYZE')
             
             conn.commit()
     
+    def _rename_legacy_tables(self, cursor) -> List[str]:
+        """
+        Move aside type-specific tables that still use a surrogate id column.
+        
+        Returns:
+            Names of the tables renamed to <name>_legacy
+        """
+        legacy_tables = []
+        for table in _METADATA_TABLES.values():
+            columns = [row[1] for row in cursor.execute(f"PRAGMA table_info({table})").fetchall()]
+            if 'id' in columns:
+                cursor.execute(f"ALTER TABLE {table} RENAME TO {table}_legacy")
+                legacy_tables.append(table)
+        return legacy_tables
+    
     def insert_file(self, metadata: Dict[str, Any]) -> int:
         """
         Insert file metadata into database.
@@ -193,161 +614,191 @@ class MetadataDatabase:
         Returns:
             File ID
         """
+        (_, file_rows), *statements = self._build_rows([metadata])
+        
         with self.get_connection() as conn:
             cursor = conn.cursor()
+            self._begin(cursor)
             
             # Insert into files table
-            cursor.execute('''
-                INSERT OR REPLACE INTO files 
-                (file_path, file_name, file_type, file_size, mime_type, created_date, modified_date)
-                VALUES (?, ?, ?, ?, ?, ?, ?)
-            ''', (
-                metadata.get('file_path'),
-                metadata.get('file_name'),
-                metadata.get('file_type'),
-                metadata.get('file_size'),
-                metadata.get('mime_type'),
-                metadata.get('created_date'),
-                metadata.get('modified_date')
-            ))
-            
-            file_id = cursor.lastrowid
-            
-            # Insert type-specific metadata
-            file_type = metadata.get('file_type')
+            cursor.execute(_SQL_UPSERT_FILES_RETURNING_ID, file_rows[0])
+            file_id = cursor.fetchone()[0]
             
-            if file_type == 'image':
-                self._insert_image_metadata(cursor, file_id, metadata)
-            elif file_type == 'video':
-                self._insert_video_metadata(cursor, file_id, metadata)
-            elif file_type == 'audio':
-                self._insert_audio_metadata(cursor, file_id, metadata)
-            elif file_type == 'document':
-                self._insert_document_metadata(cursor, file_id, metadata)
+            # Replace type-specific metadata
+            for sql, rows in statements:
+                cursor.executemany(sql, rows)
             
-            conn.commit()
             return file_id
     
-    def _insert_image_metadata(self, cursor, file_id: int, metadata: Dict[str, Any]):
-        """Insert image-specific metadata."""
-        gps = metadata.get('gps_coordinates', {})
-        
-        cursor.execute('''
-            INSERT INTO image_metadata 
-            (file_id, width, height, camera_make, camera_model, lens_model, 
-             focal_length, aperture, shutter_speed, iso, flash, orientation,
-             color_space, date_taken, gps_latitude, gps_longitude, gps_altitude,
-             software, format)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        ''', (
-            file_id,
-            metadata.get('width'),
-            metadata.get('height'),
-            metadata.get('camera_make'),
-            metadata.get('camera_model'),
-            metadata.get('lens_model'),
-            metadata.get('focal_length'),
-            metadata.get('aperture'),
-            metadata.get('shutter_speed'),
-            metadata.get('iso'),
-            metadata.get('flash'),
-            metadata.get('orientation'),
-            metadata.get('color_space'),
-            metadata.get('date_taken'),
-            gps.get('latitude') if gps else None,
-            gps.get('longitude') if gps else None,
-            gps.get('altitude') if gps else None,
-            metadata.get('software'),
-            metadata.get('format')
-        ))
-    
-    def _insert_video_metadata(self, cursor, file_id: int, metadata: Dict[str, Any]):
-        """Insert video-specific metadata."""
-        cursor.execute('''
-            INSERT INTO video_metadata 
-            (file_id, duration, width, height, codec, frame_rate, bitrate,
-             audio_codec, audio_sample_rate, audio_channels)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        ''', (
-            file_id,
-            metadata.get('duration'),
-            metadata.get('width'),
-            metadata.get('height'),
-            metadata.get('codec'),
-            metadata.get('frame_rate'),
-            metadata.get('bitrate'),
-            metadata.get('audio_codec'),
-            metadata.get('audio_sample_rate'),
-            metadata.get('audio_channels')
-        ))
-    
-    def _insert_audio_metadata(self, cursor, file_id: int, metadata: Dict[str, Any]):
-        """Insert audio-specific metadata."""
-        cursor.execute('''
-            INSERT INTO audio_metadata 
-            (file_id, title, artist, album, album_artist, genre, year,
-             track_number, duration, bitrate, sample_rate, channels, codec)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        ''', (
-            file_id,
-            metadata.get('title'),
-            metadata.get('artist'),
-            metadata.get('album'),
-            metadata.get('album_artist'),
-            metadata.get('genre'),
-            metadata.get('year'),
-            metadata.get('track_number'),
-            metadata.get('duration'),
-            metadata.get('bitrate'),
-            metadata.get('sample_rate'),
-            metadata.get('channels'),
-            metadata.get('codec')
-        ))
-    
-    def _insert_document_metadata(self, cursor, file_id: int, metadata: Dict[str, Any]):
-        """Insert document-specific metadata."""
-        keywords = metadata.get('keywords')
-        if isinstance(keywords, list):
-            keywords = ','.join(keywords)
-        
-        cursor.execute('''
-            INSERT INTO document_metadata 
-            (file_id, title, author, subject, creator, producer, keywords,
-             page_count, word_count, creation_date, modification_date)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        ''', (
-            file_id,
-            metadata.get('title'),
-            metadata.get('author'),
-            metadata.get('subject'),
-            metadata.get('creator'),
-            metadata.get('producer'),
-            keywords,
-            metadata.get('page_count'),
-            metadata.get('word_count'),
-            metadata.get('creation_date'),
-            metadata.get('modification_date')
-        ))
+    @staticmethod
+    def _build_rows(metadata_list: List[Dict[str, Any]]) -> List[Tuple[str, List[tuple]]]:
+        """
+        Build INSERT parameters for a chunk of metadata dictionaries.
+        
+        Returns:
+            (SQL, rows) pairs in the order they must be executed
+        """
+        by_type = {file_type: [] for file_type in _METADATA_TABLES}
+        for metadata in metadata_list:
+            if metadata.get('file_type') in by_type:
+                by_type[metadata.get('file_type')].append(metadata)
+        
+        images = by_type['image']
+        documents = by_type['document']
+        
+        # Derived columns built once, then every row is a flat tuple for executemany
+        gps_column = [metadata.get('gps_coordinates') or {} for metadata in images]
+        keywords_column = [metadata.get('keywords') for metadata in documents]
+        keywords_column = [
+            json.dumps(keywords) if isinstance(keywords, list) else keywords
+            for keywords in keywords_column
+        ]
+        
+        file_rows = [tuple(_db_values(metadata, _FILE_KEYS, _FILE_EPOCHS)) for metadata in metadata_list]
+        path_rows = [row[:1] for row in file_rows]
+        
+        return [
+            (_SQL_UPSERT_FILES, file_rows),
+            *((sql, path_rows) for sql in _SQL_DELETE_TYPE_METADATA),
+            (_SQL_INSERT_IMAGE, [
+                (metadata.get('file_path'), *_db_values(metadata, _IMAGE_KEYS, _IMAGE_EPOCHS), *map(gps.get, _GPS_KEYS))
+                for metadata, gps in zip(images, gps_column)
+            ]),
+            (_SQL_INSERT_VIDEO, [
+                (metadata.get('file_path'), *map(metadata.get, _VIDEO_KEYS))
+                for metadata in by_type['video']
+            ]),
+            (_SQL_INSERT_AUDIO, [
+                (metadata.get('file_path'), *map(metadata.get, _AUDIO_KEYS))
+                for metadata in by_type['audio']
+            ]),
+            (_SQL_INSERT_DOCUMENT, [
+                (metadata.get('file_path'), *_db_values(metadata, _DOCUMENT_KEYS, _DOCUMENT_EPOCHS), keywords)
+                for metadata, keywords in zip(documents, keywords_column)
+            ]),
+            (_SQL_INSERT_KEYWORDS, [
+                (metadata.get('file_path'), keywords)
+                for metadata, keywords in zip(documents, keywords_column)
+                if isinstance(metadata.get('keywords'), list)
+            ]),
+        ]
     
-    def insert_batch(self, metadata_list: List[Dict[str, Any]]) -> List[int]:
+    def insert_batch(
+        self,
+        metadata_list: List[Dict[str, Any]],
+        chunk_size: int = 1000,
+        max_workers: int = 4
+    ) -> List[int]:
         """
         Insert multiple files at once.
         
+        Records missing a required field are set aside up front. The rest
+        are built into INSERT rows chunk by chunk on worker threads while
+        this thread, the only writer, runs them with executemany inside a
+        single transaction. Workers stay at most 2 * max_workers chunks
+        ahead of the writer, so only those chunks' rows are held in memory
+        at once. If that transaction fails, files are inserted
+        one by one so that valid rows are still stored. Rejected records
+        are listed in self.errors.
+        
         Args:
             metadata_list: List of metadata dictionaries
+            chunk_size: Number of files per prepared chunk
+            max_workers: Number of threads building rows
         
         Returns:
-            List of file IDs
+            List of file IDs for the stored records
         """
-        file_ids = []
+        self.errors = []
+        
+        # Validate once up front rather than catching failures row by row
+        valid = []
         for metadata in metadata_list:
+            if None in map(metadata.get, _REQUIRED_KEYS):
+                missing = [key for key in _REQUIRED_KEYS if metadata.get(key) is None]
+                self.errors.append({
+                    'file': metadata.get('file_path'),
+                    'error': f"missing required field(s): {', '.join(missing)}",
+                    'type': 'validation_error'
+                })
+            else:
+                valid.append(metadata)
+        
+        if not valid:
+            return []
+        
+        chunks = (
+            valid[start:start + chunk_size]
+            for start in range(0, len(valid), chunk_size)
+        )
+        
+        try:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor, self.get_connection() as conn:
+                cursor = conn.cursor()
+                self._begin(cursor)
+                
+                # Submit one more chunk for each one written instead of all at once
+                building = deque(
+                    executor.submit(self._build_rows, chunk)
+                    for chunk in islice(chunks, 2 * max_workers)
+                )
+                while building:
+                    statements = building.popleft().result()
+                    for chunk in islice(chunks, 1):
+                        building.append(executor.submit(self._build_rows, chunk))
+                    
+                    for sql, rows in statements:
+                        cursor.executemany(sql, rows)
+                
+                # Look up the assigned IDs by path (chunked to stay under the variable limit)
+                paths = list(dict.fromkeys(metadata['file_path'] for metadata in valid))
+                path_ids = {}
+                for start in range(0, len(paths), 500):
+                    chunk = paths[start:start + 500]
+                    placeholders = ', '.join('?' * len(chunk))
+                    cursor.execute(f"SELECT id, file_path FROM files WHERE file_path IN ({placeholders})", chunk)
+                    path_ids.update((row['file_path'], row['id']) for row in cursor)
+            
+            return [path_ids[metadata['file_path']] for metadata in valid]
+        
+        except sqlite3.Error:
+            pass
+        
+        file_ids = []
+        for metadata in valid:
             try:
-                file_id = self.insert_file(metadata)
-                file_ids.append(file_id)
+                file_ids.append(self.insert_file(metadata))
             except Exception as e:
-                print(f"Error inserting {metadata.get('file_path')}: {e}")
+                self.errors.append({
+                    'file': metadata.get('file_path'),
+                    'error': str(e),
+                    'type': 'insert_error'
+                })
         return file_ids
     
+    def insert_metadata_fields(self, file_id: int, fields: Dict[str, Any]) -> int:
+        """
+        Insert generic key-value metadata for a file.
+        
+        Args:
+            file_id: ID of the file the fields belong to
+            fields: Mapping of field names to values (stored as text)
+        
+        Returns:
+            Number of fields inserted
+        """
+        rows = [
+            (file_id, name, None if value is None else str(value))
+            for name, value in fields.items()
+        ]
+        
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            self._begin(cursor)
+            cursor.executemany(_SQL_INSERT_FIELD, rows)
+        
+        return len(rows)
+    
     def query_files(
         self, 
         file_type: Optional[str] = None,
@@ -362,96 +813,121 @@ class MetadataDatabase:
             file_type: Filter by file type
             limit: Maximum number of results
             offset: Number of results to skip
-            order_by: SQL ORDER BY clause
+            order_by: Column name optionally followed by ASC or DESC
         
         Returns:
             List of file metadata dictionaries
         """
-        with self.get_connection() as conn:
+        column, _, direction = order_by.strip().partition(' ')
+        direction = direction.strip().upper() or 'ASC'
+        query = _SQL_QUERY_FILES.get((f"{column.lower()} {direction}", bool(file_type)))
+        if query is None:
+            raise ValueError(f"Unsupported order_by: {order_by!r}")
+        
+        params = [file_type] if file_type else []
+        params += [limit or -1, offset or 0]
+        
+        with self.get_connection(read_only=True) as conn:
             cursor = conn.cursor()
+            cursor.execute(query, params)
             
-            query = "SELECT * FROM files"
-            params = []
-            
-            if file_type:
-                query += " WHERE file_type = ?"
-                params.append(file_type)
-            
-            query += f" ORDER BY {order_by}"
-            
-            if limit:
-                query += " LIMIT ?"
-                params.append(limit)
-            
-            if offset:
-                query += " OFFSET ?"
-                params.append(offset)
+            return [dict(row) for row in cursor]
+    
+    def query_files_iter(
+        self,
+        file_type: Optional[str] = None,
+        batch_size: int = 1000,
+        as_dict: bool = False
+    ) -> Iterator[Any]:
+        """
+        Iterate over files in ID order without loading them all at once.
+        
+        Pages are fetched with keyset pagination (id > last seen id) instead
+        of OFFSET, and a pooled connection is only held while a page is read.
+        
+        Args:
+            file_type: Filter by file type
+            batch_size: Number of rows fetched per page
+            as_dict: Yield dictionaries instead of sqlite3.Row objects
+        
+        Yields:
+            One row per file
+        """
+        query = _SQL_ITER_FILES[bool(file_type)]
+        prefix = [file_type] if file_type else []
+        last_id = 0
+        
+        while True:
+            with self.get_connection(read_only=True) as conn:
+                rows = conn.execute(query, prefix + [last_id, batch_size]).fetchall()
             
-            cursor.execute(query, params)
-            rows = cursor.fetchall()
+            for row in rows:
+                yield dict(row) if as_dict else row
             
-            return [dict(row) for row in rows]
+            if len(rows) < batch_size:
+                return
+            last_id = rows[-1]['id']
     
     def get_file_by_id(self, file_id: int) -> Optional[Dict[str, Any]]:
         """Get complete file metadata by ID."""
-        with self.get_connection() as conn:
+        with self.get_connection(read_only=True) as conn:
             cursor = conn.cursor()
             
-            # Get base file info
-            cursor.execute("SELECT * FROM files WHERE id = ?", (file_id,))
-            file_row = cursor.fetchone()
+            # Base file info and type-specific metadata in a single query
+            cursor.execute(_SQL_FILE_BY_ID, (file_id,))
+            row = cursor.fetchone()
             
-            if not file_row:
+            if not row:
                 return None
             
-            file_data = dict(file_row)
+            names = [column[0] for column in cursor.description]
+            start = self._column_counts['files']
+            file_data = dict(zip(names[:start], row[:start]))
             file_type = file_data['file_type']
             
-            # Get type-specific metadata
-            if file_type == 'image':
-                cursor.execute("SELECT * FROM image_metadata WHERE file_id = ?", (file_id,))
-                meta_row = cursor.fetchone()
-                if meta_row:
-                    file_data.update(dict(meta_row))
-            
-            elif file_type == 'video':
-                cursor.execute("SELECT * FROM video_metadata WHERE file_id = ?", (file_id,))
-                meta_row = cursor.fetchone()
-                if meta_row:
-                    file_data.update(dict(meta_row))
-            
-            elif file_type == 'audio':
-                cursor.execute("SELECT * FROM audio_metadata WHERE file_id = ?", (file_id,))
-                meta_row = cursor.fetchone()
-                if meta_row:
-                    file_data.update(dict(meta_row))
-            
-            elif file_type == 'document':
-                cursor.execute("SELECT * FROM document_metadata WHERE file_id = ?", (file_id,))
-                meta_row = cursor.fetchone()
-                if meta_row:
-                    file_data.update(dict(meta_row))
+            for table_type, table in _METADATA_TABLES.items():
+                end = start + self._column_counts[table]
+                if table_type == file_type:
+                    meta = dict(zip(names[start:end], row[start:end]))
+                    if meta['file_id'] is not None:
+                        file_data.update(meta)
+                    break
+                start = end
             
             return file_data
     
     def get_files_with_gps(self) -> List[Dict[str, Any]]:
         """Get all files with GPS coordinates."""
-        with self.get_connection() as conn:
+        with self.get_connection(read_only=True) as conn:
             cursor = conn.cursor()
             
             cursor.execute('''
                 SELECT f.*, i.gps_latitude, i.gps_longitude, i.gps_altitude
-                FROM files f
-                JOIN image_metadata i ON f.id = i.file_id
+                FROM image_metadata i
+                JOIN files f ON f.id = i.file_id
                 WHERE i.gps_latitude IS NOT NULL AND i.gps_longitude IS NOT NULL
             ''')
             
             rows = cursor.fetchall()
             return [dict(row) for row in rows]
     
+    def get_files_by_keyword(self, keyword: str) -> List[Dict[str, Any]]:
+        """Get all documents tagged with the given keyword."""
+        with self.get_connection(read_only=True) as conn:
+            cursor = conn.cursor()
+            
+            cursor.execute('''
+                SELECT f.*
+                FROM document_keywords k
+                JOIN files f ON f.id = k.file_id
+                WHERE k.keyword = ?
+            ''', (keyword,))
+            
+            return [dict(row) for row in cursor]
+    
     def get_unique_cameras(self) -> List[Tuple[str, int]]:
         """Get list of unique cameras with file counts."""
-        with self.get_connection() as conn:
+        with self.get_connection(read_only=True) as conn:
             cursor = conn.cursor()
             
             cursor.execute('''
@@ -466,51 +942,54 @@ class MetadataDatabase:
     
     def get_statistics(self) -> Dict[str, Any]:
         """Get database statistics."""
-        with self.get_connection() as conn:
+        with self.get_connection(read_only=True) as conn:
             cursor = conn.cursor()
             
             stats = {}
             
-            # Total files
-            cursor.execute("SELECT COUNT(*) FROM files")
-            stats['total_files'] = cursor.fetchone()[0]
-            
-            # Files by type
+            # One pass over files: per-type counts, sizes and date bounds (epoch
+            # seconds only, so a stray non-date text value cannot end up in them)
             cursor.execute('''
-                SELECT file_type, COUNT(*) as count
+                SELECT file_type, COUNT(*), SUM(file_size),
+                       MIN(CASE WHEN typeof(created_date) = 'integer' THEN created_date END),
+                       MAX(CASE WHEN typeof(created_date) = 'integer' THEN created_date END)
                 FROM files
                 GROUP BY file_type
+                ORDER BY COUNT(*) DESC, file_type
             ''')
-            stats['files_by_type'] = dict(cursor.fetchall())
+            groups = cursor.fetchall()
+            
+            stats['total_files'] = sum(group[1] for group in groups)
+            stats['files_by_type'] = {group[0]: group[1] for group in groups}
             
             # Total size
-            cursor.execute("SELECT SUM(file_size) FROM files")
-            total_bytes = cursor.fetchone()[0] or 0
+            total_bytes = sum(group[2] or 0 for group in groups)
             stats['total_size_mb'] = round(total_bytes / (1024 * 1024), 2)
             stats['average_size_mb'] = round(total_bytes / stats['total_files'] / (1024 * 1024), 2) if stats['total_files'] > 0 else 0
             
             # Date range
-            cursor.execute("SELECT MIN(created_date), MAX(created_date) FROM files WHERE created_date IS NOT NULL")
-            min_date, max_date = cursor.fetchone()
-            if min_date and max_date:
-                stats['date_range'] = {'min': min_date, 'max': max_date}
+            min_dates = [group[3] for group in groups if group[3] is not None]
+            max_dates = [group[4] for group in groups if group[4] is not None]
+            if min_dates and max_dates:
+                stats['date_range'] = {
+                    'min': _EPOCH + timedelta(seconds=min(min_dates)),
+                    'max': _EPOCH + timedelta(seconds=max(max_dates))
+                }
             
-            # Unique cameras
-            cursor.execute("SELECT COUNT(DISTINCT camera_model) FROM image_metadata WHERE camera_model IS NOT NULL")
-            stats['unique_cameras'] = cursor.fetchone()[0]
-            
-            # Files with GPS
-            cursor.execute("SELECT COUNT(*) FROM image_metadata WHERE gps_latitude IS NOT NULL")
-            stats['files_with_gps'] = cursor.fetchone()[0]
+            # One pass over image_metadata: unique cameras and files with GPS
+            cursor.execute("SELECT COUNT(DISTINCT camera_model), COUNT(gps_latitude) FROM image_metadata")
+            stats['unique_cameras'], stats['files_with_gps'] = cursor.fetchone()
             
             return stats
     
-    def export_to_dataframe(self, file_type: Optional[str] = None):
+    def export_to_dataframe(self, file_type: Optional[str] = None, dtype_backend: Optional[str] = None):
         """
         Export data to pandas DataFrame.
         
         Args:
             file_type: Filter by file type (optional)
+            dtype_backend: 'pyarrow' for Arrow-backed columns (pandas 2.0+
+                with pyarrow), skipping object-dtype intermediates
         
         Returns:
             pandas DataFrame
@@ -518,43 +997,86 @@ class MetadataDatabase:
         if not PANDAS_AVAILABLE:
             raise ImportError("pandas is required for DataFrame export")
         
-        with self.get_connection() as conn:
-            if file_type:
-                if file_type == 'image':
-                    query = '''
-                        SELECT f.*, i.*
-                        FROM files f
-                        LEFT JOIN image_metadata i ON f.id = i.file_id
-                        WHERE f.file_type = 'image'
-                    '''
-                elif file_type == 'video':
-                    query = '''
-                        SELECT f.*, v.*
-                        FROM files f
-                        LEFT JOIN video_metadata v ON f.id = v.file_id
-                        WHERE f.file_type = 'video'
-                    '''
-                elif file_type == 'audio':
-                    query = '''
-                        SELECT f.*, a.*
-                        FROM files f
-                        LEFT JOIN audio_metadata a ON f.id = a.file_id
-                        WHERE f.file_type = 'audio'
-                    '''
-                elif file_type == 'document':
-                    query = '''
-                        SELECT f.*, d.*
-                        FROM files f
-                        LEFT JOIN document_metadata d ON f.id = d.file_id
-                        WHERE f.file_type = 'document'
-                    '''
-                else:
-                    query = "SELECT * FROM files WHERE file_type = ?"
+        params = ()
+        if file_type:
+            if file_type == 'image':
+                query = '''
+                    SELECT f.*, i.*
+                    FROM files f
+                    LEFT JOIN image_metadata i ON f.id = i.file_id
+                    WHERE f.file_type = 'image'
+                '''
+            elif file_type == 'video':
+                query = '''
+                    SELECT f.*, v.*
+                    FROM files f
+                    LEFT JOIN video_metadata v ON f.id = v.file_id
+                    WHERE f.file_type = 'video'
+                '''
+            elif file_type == 'audio':
+                query = '''
+                    SELECT f.*, a.*
+                    FROM files f
+                    LEFT JOIN audio_metadata a ON f.id = a.file_id
+                    WHERE f.file_type = 'audio'
+                '''
+            elif file_type == 'document':
+                query = '''
+                    SELECT f.*, d.*
+                    FROM files f
+                    LEFT JOIN document_metadata d ON f.id = d.file_id
+                    WHERE f.file_type = 'document'
+                '''
             else:
-                query = "SELECT * FROM files"
-            
-            df = pd.read_sql_query(query, conn)
-            return df
+                query = "SELECT * FROM files WHERE file_type = ?"
+                params = (file_type,)
+        else:
+            query = "SELECT * FROM files"
+        
+        if ADBC_AVAILABLE:
+            try:
+                return self._export_arrow(query, params, dtype_backend)
+            except (adbc_sqlite.Error, OSError):
+                # Driver could not type a column (e.g. rows added between the
+                # count and the query); the sqlite3 path handles any mix
+                pass
+        
+        kwargs = {'dtype_backend': dtype_backend} if dtype_backend else {}
+        with self.get_connection(read_only=True) as conn:
+            return pd.read_sql_query(query, conn, params=params, **kwargs)
+    
+    def _export_arrow(self, query: str, params: tuple, dtype_backend: Optional[str]):
+        """
+        Run an export query through the ADBC SQLite driver into a DataFrame.
+        
+        Column batches go straight into Arrow instead of building row tuples.
+        The driver types each column from its first batch, so a nullable
+        column that is NULL throughout that batch and filled later fails the
+        fetch; the batch is sized to the whole result so every value is seen.
+        
+        Raises:
+            adbc_sqlite.Error, OSError: If the driver cannot type a column
+        """
+        with adbc_sqlite.connect(self._read_uri) as conn:
+            with conn.cursor() as cursor:
+                cursor.execute(f"SELECT COUNT(*) FROM ({query})", params)
+                rows = cursor.fetchone()[0]
+                cursor.adbc_statement.set_options(**{_ADBC_BATCH_ROWS: str(max(rows, 1))})
+                cursor.execute(query, params)
+                table = cursor.fetch_arrow_table()
+        
+        # Arrow sees the raw epoch seconds; the row factory only runs on sqlite3
+        # connections. Casting in Arrow keeps NULLs as nulls (the values behind
+        # them are undefined and must not be converted)
+        for i, field in enumerate(table.schema):
+            if field.name in _TIMESTAMP_COLUMNS and pa.types.is_integer(field.type):
+                timestamps = table.column(i).cast(pa.timestamp('s')).cast(pa.timestamp('ns'))
+                table = table.set_column(i, field.name, timestamps)
+        
+        if dtype_backend == 'pyarrow':
+            # Timestamps stay datetime64 columns, as the .dt-based consumers expect
+            return table.to_pandas(types_mapper=lambda t: None if pa.types.is_timestamp(t) else pd.ArrowDtype(t))
+        return table.to_pandas()
     
     def delete_file(self, file_id: int) -> bool:
         """Delete file and its metadata."""
@@ -567,6 +1089,7 @@ class MetadataDatabase:
         """Delete all data from database."""
         with self.get_connection() as conn:
             cursor = conn.cursor()
+            self._begin(cursor)
             cursor.execute("SELECT COUNT(*) FROM files")
             count = cursor.fetchone()[0]
             
@@ -575,14 +1098,34 @@ class MetadataDatabase:
             cursor.execute("DELETE FROM video_metadata")
             cursor.execute("DELETE FROM audio_metadata")
             cursor.execute("DELETE FROM document_metadata")
+            cursor.execute("DELETE FROM document_keywords")
             cursor.execute("DELETE FROM metadata_fields")
             
             return count
     
-    def vacuum(self):
-        """Optimize database (reclaim space after deletions)."""
+    def vacuum(self, pages: int = 0):
+        """
+        Reclaim space after deletions.
+        
+        Frees pages incrementally instead of rewriting the whole file.
+        Databases created before incremental auto-vacuum was enabled get
+        one full VACUUM, which switches them over.
+        
+        Args:
+            pages: Maximum number of free pages to release (0 for all)
+        """
+        with self.get_connection() as conn:
+            if conn.execute("PRAGMA auto_vacuum").fetchone()[0] != 2:
+                conn.execute("PRAGMA auto_vacuum=INCREMENTAL")
+                conn.execute("VACUUM")
+            else:
+                # executescript steps the pragma to completion (execute frees a single page)
+                conn.executescript(f"PRAGMA incremental_vacuum({int(pages)})")
+    
+    def optimize(self):
+        """Let SQLite refresh planner statistics that have gone stale."""
         with self.get_connection() as conn:
-            conn.execute("VACUUM")
+            conn.execute("PRAGMA optimize")
 
 
 if __name__ == "__main__":
@@ -6,37 +6,57 @@ This module provides the MetadataAggregator class for scanning directories,
 processing multiple files, and extracting metadata efficiently.
 """
 
+import asyncio
+import csv
+import io
+import itertools
+import math
+import multiprocessing
 import os
+import pickle
+import shutil
+import sqlite3
+import struct
+import subprocess
 import sys
+import threading
+import zipfile
+from contextlib import ExitStack
 from pathlib import Path
-from typing import List, Dict, Optional, Any, Callable
-from datetime import datetime
+from typing import List, Dict, Optional, Any, Callable, Tuple, Iterator, FrozenSet, BinaryIO, NamedTuple
+from datetime import datetime, timezone
 import time
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import warnings
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from tqdm import tqdm
 import magic
+import numpy as np
 import json
 
 # Import existing extractors
 from PIL import Image
 from PIL.ExifTags import GPSTAGS, TAGS
-import exifread
 import eyed3
 
 try:
-    import moviepy.editor as mp
+    import mutagen
 except ImportError:
-    mp = None
+    mutagen = None
 
 try:
-    import pdfplumber
+    from pypdf import PdfReader
 except ImportError:
-    pdfplumber = None
+    PdfReader = None
 
 try:
-    from docx import Document as DocxDocument
+    from lxml import etree
 except ImportError:
-    DocxDocument = None
+    etree = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 from .data_models import (
     FileMetadata, ImageMetadata, VideoMetadata, 
@@ -44,6 +64,343 @@ from .data_models import (
     BatchProcessResult
 )
 
+# Bytes read from the start of each file for MIME sniffing; images read enough
+# to cover a JPEG APP1 segment so EXIF can usually be parsed from memory
+_HEADER_SIZE = 4096
+_EXIF_HEADER_SIZE = 64 * 1024
+
+# scan_directory walks top-level subdirectories on up to this many threads
+# once the root has at least _PARALLEL_SCAN_MIN_SUBDIRS of them
+_SCAN_WORKERS = 16
+_PARALLEL_SCAN_MIN_SUBDIRS = 4
+
+# Bump when extractor output changes so stale cache entries are discarded
+_CACHE_VERSION = 1
+
+_SQL_CACHE_GET = 'SELECT metadata FROM metadata_cache WHERE path = ? AND mtime_ns = ? AND size = ?'
+_SQL_CACHE_PUT = 'INSERT OR REPLACE INTO metadata_cache (path, mtime_ns, size, metadata) VALUES (?, ?, ?, ?)'
+
+# Worker processes are forked so that scripts calling process_batch at module
+# level are not re-run in each child. Only on Linux: macOS system frameworks are
+# not fork-safe (CPython defaults to spawn there), so elsewhere everything stays on threads
+_FORK_CONTEXT = multiprocessing.get_context('fork') if sys.platform == 'linux' else None
+
+
+def _read_header(
+    file_path: str,
+    size: int = _HEADER_SIZE,
+    stat: Optional[os.stat_result] = None
+) -> Tuple[bytes, os.stat_result]:
+    """
+    Open a file once, returning its first bytes and its stat result (reusing stat if given).
+    
+    Works on a raw descriptor: open, read and close, plus fstat only when no
+    stat is passed. A buffered file object would add its own fstat, isatty
+    ioctl and lseek to every file.
+    """
+    fd = os.open(file_path, os.O_RDONLY | getattr(os, 'O_BINARY', 0))
+    try:
+        return os.read(fd, size), stat if stat is not None else os.fstat(fd)
+    finally:
+        os.close(fd)
+
+
+# TIFF field type -> (struct code, bytes per value); rationals are code pairs
+_TIFF_TYPES = {
+    1: ('B', 1), 2: ('s', 1), 3: ('H', 2), 4: ('I', 4), 5: ('II', 8),
+    6: ('b', 1), 7: ('s', 1), 8: ('h', 2), 9: ('i', 4), 10: ('ii', 8),
+    11: ('f', 4), 12: ('d', 8),
+}
+# Sniffed MIME type -> PIL format name, so PIL is not needed just for the format
+_MIME_TO_FORMAT = {
+    'image/jpeg': 'JPEG',
+    'image/png': 'PNG',
+    'image/gif': 'GIF',
+    'image/bmp': 'BMP',
+    'image/x-ms-bmp': 'BMP',
+    'image/tiff': 'TIFF',
+}
+
+_EXIF_IFD_POINTER = 0x8769
+_GPS_IFD_POINTER = 0x8825
+
+# The only IFD0/Exif and GPS tags _process_image uses; everything else is skipped undecoded
+_IMAGE_TAG_IDS = frozenset({
+    0x0100, 0x0101, 0x010f, 0x0110,          # ImageWidth, ImageLength, Make, Model
+    0x829a, 0x829d, 0x8827, 0x9003, 0x920a,  # ExposureTime, FNumber, ISO, DateTimeOriginal, FocalLength
+    0xa434,                                  # LensModel
+    _EXIF_IFD_POINTER, _GPS_IFD_POINTER,
+})
+_GPS_TAG_IDS = frozenset({0x0001, 0x0002, 0x0003, 0x0004, 0x0006})
+
+
+def _read_exact(fp: BinaryIO, offset: int, size: int) -> bytes:
+    """Read size bytes at offset, raising ValueError if the data runs out."""
+    fp.seek(offset)
+    data = fp.read(size)
+    if len(data) != size:
+        raise ValueError(f"EXIF data truncated at offset {offset}")
+    return data
+
+
+def _find_tiff_header(fp: BinaryIO) -> Optional[int]:
+    """Return the offset of the TIFF header holding EXIF data, or None if there is none."""
+    fp.seek(0)
+    start = fp.read(8)
+    if start[:4] in (b'II*\x00', b'MM\x00*'):
+        return 0
+    
+    if start[:2] == b'\xff\xd8':
+        # Walk JPEG segments up to the start of scan looking for an Exif APP1
+        pos = 2
+        while True:
+            marker = _read_exact(fp, pos, 4)
+            if marker[0] != 0xff or marker[1] in (0xd9, 0xda):
+                return None
+            if marker[1] == 0xe1 and _read_exact(fp, pos + 4, 6) == b'Exif\x00\x00':
+                return pos + 10
+            pos += 2 + struct.unpack('>H', marker[2:])[0]
+    
+    if start == b'\x89PNG\r\n\x1a\n':
+        pos = 8
+        while True:
+            length, kind = struct.unpack('>I4s', _read_exact(fp, pos, 8))
+            if kind == b'eXIf':
+                return pos + 8
+            if kind == b'IEND':
+                return None
+            pos += 12 + length
+    
+    return None
+
+
+def _read_ifd(fp: BinaryIO, base: int, offset: int, endian: str, wanted: FrozenSet[int]) -> Dict[int, Any]:
+    """
+    Decode the wanted entries of one IFD.
+    
+    ASCII values become strings, undefined values bytes, rationals lists of
+    (numerator, denominator) pairs and all other types lists of numbers.
+    """
+    count = struct.unpack(endian + 'H', _read_exact(fp, base + offset, 2))[0]
+    entries = _read_exact(fp, base + offset + 2, 12 * count)
+    
+    values = {}
+    for i in range(0, 12 * count, 12):
+        tag, field_type, n = struct.unpack_from(endian + 'HHI', entries, i)
+        if tag not in wanted or field_type not in _TIFF_TYPES:
+            continue
+        code, size = _TIFF_TYPES[field_type]
+        length = size * n
+        if length <= 4:
+            raw = entries[i + 8:i + 8 + length]
+        else:
+            raw = _read_exact(fp, base + struct.unpack_from(endian + 'I', entries, i + 8)[0], length)
+        
+        if field_type == 2:
+            values[tag] = raw.split(b'\x00', 1)[0].decode('utf-8', 'replace')
+        elif field_type == 7:
+            values[tag] = raw
+        else:
+            numbers = struct.unpack(f'{endian}{n * len(code)}{code[0]}', raw)
+            if len(code) == 2:
+                numbers = list(zip(numbers[::2], numbers[1::2]))
+            values[tag] = list(numbers)
+    return values
+
+
+def _read_exif(fp: BinaryIO) -> Tuple[Dict[int, Any], Dict[int, Any]]:
+    """
+    Read the EXIF tags _process_image needs from a JPEG, TIFF or PNG stream.
+    
+    Only IFD0, the Exif sub-IFD and the GPS IFD are visited, and only the
+    entries listed in _IMAGE_TAG_IDS / _GPS_TAG_IDS are decoded.
+    
+    Returns:
+        Tuple of (IFD0 and Exif tags, GPS tags), keyed by tag ID
+    
+    Raises:
+        ValueError: If the stream ends before the EXIF data does
+    """
+    base = _find_tiff_header(fp)
+    if base is None:
+        return {}, {}
+    
+    head = _read_exact(fp, base, 8)
+    endian = '<' if head[:2] == b'II' else '>'
+    tags = _read_ifd(fp, base, struct.unpack(endian + 'I', head[4:])[0], endian, _IMAGE_TAG_IDS)
+    
+    gps = {}
+    if _EXIF_IFD_POINTER in tags:
+        tags.update(_read_ifd(fp, base, tags.pop(_EXIF_IFD_POINTER)[0], endian, _IMAGE_TAG_IDS))
+    if _GPS_IFD_POINTER in tags:
+        gps = _read_ifd(fp, base, tags.pop(_GPS_IFD_POINTER)[0], endian, _GPS_TAG_IDS)
+    return tags, gps
+
+
+# ffprobe from the FFmpeg install; video files only get file-level metadata without it
+_FFPROBE = shutil.which('ffprobe')
+_FFPROBE_MISSING = (
+    "ffprobe was not found on PATH, so video duration, resolution and frame rate "
+    "are not extracted. Install FFmpeg (e.g. 'apt install ffmpeg' or 'brew install ffmpeg')."
+)
+
+
+def _probe_video(file_path: str) -> Dict[str, Any]:
+    """Describe a video's container and streams with a single ffprobe call."""
+    completed = subprocess.run(
+        [_FFPROBE, '-v', 'error', '-print_format', 'json', '-show_format', '-show_streams', file_path],
+        capture_output=True,
+        check=True
+    )
+    return json.loads(completed.stdout)
+
+
+def _parse_frame_rate(rate: Optional[str]) -> Optional[float]:
+    """Convert an ffprobe rate such as '30000/1001' to frames per second."""
+    num, _, den = (rate or '').partition('/')
+    try:
+        return float(num) / float(den or 1)
+    except (ValueError, ZeroDivisionError):
+        return None
+
+
+_W_NS = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}'
+
+# docProps/core.xml element -> metadata key
+_DOCX_CORE_PROPERTIES = {
+    '{http://purl.org/dc/elements/1.1/}title': 'title',
+    '{http://purl.org/dc/elements/1.1/}creator': 'author',
+    '{http://purl.org/dc/elements/1.1/}subject': 'subject',
+    '{http://schemas.openxmlformats.org/package/2006/metadata/core-properties}keywords': 'keywords',
+    '{http://purl.org/dc/terms/}created': 'creation_date',
+    '{http://purl.org/dc/terms/}modified': 'modification_date',
+}
+
+
+def _parse_w3cdtf(value: str) -> Optional[datetime]:
+    """Parse a W3CDTF timestamp such as '2023-05-01T10:00:00Z' into a UTC datetime."""
+    value = value.strip()
+    stamp, offset = value[:19], value[19:].lstrip('.0123456789')
+    for template in ('%Y-%m-%dT%H:%M:%S', '%Y-%m-%d', '%Y-%m', '%Y'):
+        try:
+            parsed = datetime.strptime(stamp, template)
+            break
+        except ValueError:
+            continue
+    else:
+        return None
+    if offset not in ('', 'Z'):
+        try:
+            parsed -= datetime.strptime(offset, '%z').utcoffset()
+        except ValueError:
+            return None
+    return parsed.replace(tzinfo=timezone.utc)
+
+
+def _read_docx_core_properties(archive: zipfile.ZipFile) -> Dict[str, Any]:
+    """Read title, author, keywords and dates from a DOCX's docProps/core.xml."""
+    properties = {}
+    try:
+        with archive.open('docProps/core.xml') as f:
+            root = etree.parse(f).getroot()
+    except KeyError:
+        return properties
+    
+    for element in root:
+        key = _DOCX_CORE_PROPERTIES.get(element.tag)
+        if key in ('creation_date', 'modification_date'):
+            properties[key] = _parse_w3cdtf(element.text) if element.text else None
+        elif key is not None:
+            properties[key] = element.text or ''
+    return properties
+
+
+def _count_docx_words(archive: zipfile.ZipFile) -> int:
+    """
+    Count words in the body paragraphs of a DOCX by streaming word/document.xml.
+    
+    Runs are joined per paragraph and tabs/breaks separate words, matching
+    python-docx's paragraph text; paragraphs inside tables are not counted.
+    Parsed elements are discarded as soon as they are counted.
+    """
+    word_count = 0
+    parts = []
+    with archive.open('word/document.xml') as f:
+        tags = (_W_NS + 'p', _W_NS + 't', _W_NS + 'tab', _W_NS + 'br', _W_NS + 'cr')
+        for _, element in etree.iterparse(f, tag=tags):
+            if element.tag == _W_NS + 't':
+                parts.append(element.text or '')
+            elif element.tag != _W_NS + 'p':
+                parts.append(' ')
+            else:
+                parent = element.getparent()
+                if parent.tag == _W_NS + 'body':
+                    word_count += len(''.join(parts).split())
+                parts.clear()
+                element.clear()
+                while element.getprevious() is not None:
+                    del parent[0]
+    return word_count
+
+
+def _first_tag(tags: Any, key: str) -> Optional[str]:
+    """Return the first value of a mutagen tag as a string, or None if it is missing."""
+    values = tags.get(key)
+    return str(values[0]) if values else None
+
+
+def _open_cache(cache_path: str) -> sqlite3.Connection:
+    """Open (creating or resetting if needed) the SQLite metadata cache at cache_path."""
+    conn = sqlite3.connect(cache_path, check_same_thread=False)
+    conn.execute('PRAGMA journal_mode=WAL')
+    conn.execute('PRAGMA synchronous=NORMAL')
+    if conn.execute('PRAGMA user_version').fetchone()[0] != _CACHE_VERSION:
+        conn.executescript(f'''
+            DROP TABLE IF EXISTS metadata_cache;
+            CREATE TABLE metadata_cache (
+                path TEXT PRIMARY KEY,
+                mtime_ns INTEGER NOT NULL,
+                size INTEGER NOT NULL,
+                metadata BLOB NOT NULL
+            ) WITHOUT ROWID;
+            PRAGMA user_version = {_CACHE_VERSION};
+        ''')
+    return conn
+
+
+def _parse_exif_datetime(value: str) -> datetime:
+    """Parse an EXIF 'YYYY:MM:DD HH:MM:SS' timestamp."""
+    return datetime.strptime(value, '%Y:%m:%d %H:%M:%S')
+
+
+class _RawGPS(NamedTuple):
+    """GPS rationals read from one image, converted later in bulk by _resolve_gps."""
+    latitude: List[Tuple[int, int]]
+    latitude_ref: str
+    longitude: List[Tuple[int, int]]
+    longitude_ref: str
+    altitude: Optional[Tuple[int, int]]
+
+
+def _ratio(value: Tuple[int, int]) -> float:
+    """Convert a (numerator, denominator) pair to a float."""
+    return float(value[0]) / float(value[1])
+
+
+def _is_rationals(value: Any, count: int) -> bool:
+    """Whether value is a list of count (numerator, denominator) pairs with nonzero denominators."""
+    return (
+        isinstance(value, list) and len(value) == count
+        and all(isinstance(pair, tuple) and len(pair) == 2 and pair[1] != 0 for pair in value)
+    )
+
+
+def _format_ratio(value: Tuple[int, int]) -> str:
+    """Format a rational in lowest terms, e.g. (10, 1250) -> '1/125' and (2, 1) -> '2'."""
+    divisor = math.gcd(*value) or 1
+    num, den = value[0] // divisor, value[1] // divisor
+    return str(num) if den == 1 else f"{num}/{den}"
+
 
 class MetadataAggregator:
     """
@@ -63,19 +420,91 @@ class MetadataAggregator:
         'document': ['.pdf', '.docx']
     }
     
-    def __init__(self, verbose: bool = True):
+    # Flat lowercase extension -> file type lookup for detect_file_type
+    EXT_TO_TYPE = {ext: file_type for file_type, exts in SUPPORTED_EXTENSIONS.items() for ext in exts}
+    
+    # (EXIF tag ID, metadata key, converter) for each IFD0/Exif field
+    # _process_image reports, in output order
+    EXIF_SPEC = (
+        (0x0100, 'width', lambda v: int(v[0])),                # ImageWidth
+        (0x0101, 'height', lambda v: int(v[0])),               # ImageLength
+        (0x010f, 'camera_make', str.strip),                    # Make
+        (0x0110, 'camera_model', str.strip),                   # Model
+        (0xa434, 'lens_model', str.strip),                     # LensModel
+        (0x920a, 'focal_length', lambda v: _ratio(v[0])),      # FocalLength
+        (0x829d, 'aperture', lambda v: _ratio(v[0])),          # FNumber
+        (0x829a, 'shutter_speed', lambda v: _format_ratio(v[0])),  # ExposureTime
+        (0x8827, 'iso', lambda v: int(v[0])),                  # ISOSpeedRatings
+        (0x9003, 'date_taken', _parse_exif_datetime),          # DateTimeOriginal
+    )
+    
+    # File types whose extractors hold the GIL (EXIF, PDF and DOCX parsing);
+    # process_batch runs these in worker processes instead of threads
+    CPU_BOUND_TYPES = frozenset({'image', 'document'})
+    
+    def __init__(self, verbose: bool = True, cache_path: Optional[str] = None):
         """
         Initialize the MetadataAggregator.
         
         Args:
             verbose: Whether to print progress information
+            cache_path: SQLite file caching extracted metadata between runs;
+                files whose path, size and mtime are unchanged skip extraction
         """
         self.verbose = verbose
-        self.mime = magic.Magic(mime=True)
+        self._cache = _open_cache(cache_path) if cache_path else None
+        self._cache_lock = threading.Lock()
+        self._tls = threading.local()
+        # stat results from scan_directory, consumed by process_batch
+        self._scan_stats: Dict[str, os.stat_result] = {}
         self.results: List[Dict[str, Any]] = []
         self.errors: List[Dict[str, str]] = []
         self._progress_callback: Optional[Callable] = None
         
+    def _get_mime(self) -> magic.Magic:
+        """Return this thread's libmagic handle, creating it on first use."""
+        mime = getattr(self._tls, 'mime', None)
+        if mime is None:
+            mime = magic.Magic(mime=True)
+            self._tls.mime = mime
+        return mime
+    
+    def _cache_get(
+        self,
+        file_path: str,
+        stat: Optional[os.stat_result]
+    ) -> Tuple[Optional[os.stat_result], Optional[Dict[str, Any]]]:
+        """
+        Look a file up in the metadata cache.
+        
+        Returns:
+            Tuple of (the file's stat result, cached metadata or None);
+            the stat result is None if the file could not be stat'ed
+        """
+        if stat is None:
+            try:
+                stat = os.stat(file_path)
+            except OSError:
+                return None, None
+        with self._cache_lock:
+            row = self._cache.execute(_SQL_CACHE_GET, (file_path, stat.st_mtime_ns, stat.st_size)).fetchone()
+        return stat, (pickle.loads(row[0]) if row else None)
+    
+    def _cache_put(self, entries: List[Tuple[str, os.stat_result, Dict[str, Any]]]) -> None:
+        """Store (path, stat, metadata) entries in the metadata cache in one transaction."""
+        rows = [
+            (file_path, stat.st_mtime_ns, stat.st_size, pickle.dumps(metadata, pickle.HIGHEST_PROTOCOL))
+            for file_path, stat, metadata in entries
+        ]
+        with self._cache_lock, self._cache:
+            self._cache.executemany(_SQL_CACHE_PUT, rows)
+    
+    def close(self) -> None:
+        """Close the metadata cache, if one is open."""
+        if self._cache is not None:
+            self._cache.close()
+            self._cache = None
+    
     def scan_directory(
         self, 
         path: str, 
@@ -112,25 +541,79 @@ class MetadataAggregator:
                 if ft in self.SUPPORTED_EXTENSIONS:
                     extensions.extend(self.SUPPORTED_EXTENSIONS[ft])
         
-        # Scan for files
-        files = []
-        if recursive:
-            for ext in extensions:
-                files.extend(path_obj.rglob(f"*{ext}"))
-                files.extend(path_obj.rglob(f"*{ext.upper()}"))
-        else:
-            for ext in extensions:
-                files.extend(path_obj.glob(f"*{ext}"))
-                files.extend(path_obj.glob(f"*{ext.upper()}"))
+        # One pass per directory, matching each name against the extension set
+        entries = self._collect_files(str(path_obj), recursive, frozenset(extensions))
+        file_paths = sorted(entry.path for entry in entries)
         
-        # Convert to strings and remove duplicates
-        file_paths = sorted(list(set(str(f) for f in files)))
+        # Keep each file's stat so processing does not have to repeat it
+        for entry in entries:
+            try:
+                self._scan_stats[entry.path] = entry.stat()
+            except OSError:
+                pass
         
         if self.verbose:
             print(f"Found {len(file_paths)} files in {path}")
         
         return file_paths
     
+    @staticmethod
+    def _has_extension(name: str, extensions: FrozenSet[str]) -> bool:
+        """Check whether a file name's lowercase suffix is in extensions."""
+        dot = name.rfind('.')
+        return dot > 0 and name[dot:].lower() in extensions
+    
+    @classmethod
+    def _iter_files(cls, root: str, extensions: FrozenSet[str]) -> Iterator[os.DirEntry]:
+        """
+        Yield entries for files anywhere under root whose extension is in extensions.
+        
+        Walks with os.scandir so each directory is listed once regardless of
+        how many extensions are requested. Symlinked directories are not
+        followed, and unreadable directories are skipped.
+        """
+        pending = [root]
+        while pending:
+            try:
+                entries = os.scandir(pending.pop())
+            except OSError:
+                continue
+            with entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        pending.append(entry.path)
+                    elif entry.is_file() and cls._has_extension(entry.name, extensions):
+                        yield entry
+    
+    @classmethod
+    def _collect_files(cls, root: str, recursive: bool, extensions: FrozenSet[str]) -> List[os.DirEntry]:
+        """
+        Collect entries for matching files in root and, if recursive, below it.
+        
+        When root has enough subdirectories, each one is walked on its own
+        thread so the filesystem can serve several directory listings at once.
+        """
+        files = []
+        subdirs = []
+        with os.scandir(root) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    subdirs.append(entry.path)
+                elif entry.is_file() and cls._has_extension(entry.name, extensions):
+                    files.append(entry)
+        
+        if not recursive:
+            return files
+        
+        if len(subdirs) < _PARALLEL_SCAN_MIN_SUBDIRS:
+            for subdir in subdirs:
+                files.extend(cls._iter_files(subdir, extensions))
+        else:
+            with ThreadPoolExecutor(max_workers=min(_SCAN_WORKERS, len(subdirs))) as executor:
+                for subtree in executor.map(lambda subdir: list(cls._iter_files(subdir, extensions)), subdirs):
+                    files.extend(subtree)
+        return files
+    
     def detect_file_type(self, file_path: str) -> str:
         """
         Detect file type based on extension and MIME type.
@@ -141,37 +624,43 @@ class MetadataAggregator:
         Returns:
             File type ('image', 'video', 'audio', 'document', 'unknown')
         """
-        ext = Path(file_path).suffix.lower()
-        
-        for file_type, extensions in self.SUPPORTED_EXTENSIONS.items():
-            if ext in extensions:
-                return file_type
-        
-        return 'unknown'
+        name = file_path[file_path.rfind(os.sep) + 1:]
+        dot = name.rfind('.')
+        if dot <= 0:
+            return 'unknown'
+        return self.EXT_TO_TYPE.get(name[dot:].lower(), 'unknown')
     
-    def process_file(self, file_path: str) -> Optional[Dict[str, Any]]:
+    def process_file(self, file_path: str, stat: Optional[os.stat_result] = None) -> Optional[Dict[str, Any]]:
         """
         Process a single file and extract metadata.
         
+        With a cache configured, files unchanged since they were cached are
+        returned from it.
+        
         Args:
             file_path: Path to file
+            stat: The file's stat result if already known; saves a stat call
         
         Returns:
             Dictionary with metadata or None if failed
         """
+        if self._cache is not None:
+            stat, cached = self._cache_get(file_path, stat)
+            if cached is not None:
+                return cached
+        
+        metadata = self._extract_file(file_path, stat)
+        if metadata is not None:
+            self._resolve_gps([metadata])
+            if self._cache is not None and stat is not None:
+                self._cache_put([(file_path, stat, metadata)])
+        return metadata
+    
+    def _extract_file(self, file_path: str, stat: Optional[os.stat_result] = None) -> Optional[Dict[str, Any]]:
+        """Run the extractor for a file's type, recording any failure in self.errors."""
         try:
-            file_type = self.detect_file_type(file_path)
-            
-            if file_type == 'image':
-                return self._process_image(file_path)
-            elif file_type == 'video':
-                return self._process_video(file_path)
-            elif file_type == 'audio':
-                return self._process_audio(file_path)
-            elif file_type == 'document':
-                return self._process_document(file_path)
-            else:
-                return self._process_generic(file_path)
+            extractor = self.EXTRACTORS.get(self.detect_file_type(file_path), MetadataAggregator._process_generic)
+            return extractor(self, file_path, stat)
                 
         except Exception as e:
             self.errors.append({
@@ -183,225 +672,275 @@ class MetadataAggregator:
                 print(f"Error processing {file_path}: {e}")
             return None
     
-    def _process_image(self, file_path: str) -> Dict[str, Any]:
-        """Extract metadata from image file."""
-        metadata = {
+    def _base_metadata(
+        self,
+        file_path: str,
+        file_type: str,
+        header: bytes,
+        stat: os.stat_result
+    ) -> Dict[str, Any]:
+        """Build the fields every extractor reports, from the file header and stat."""
+        return {
             'file_path': file_path,
-            'file_name': os.path.basename(file_path),
-            'file_type': 'image',
-            'file_size': os.path.getsize(file_path),
-            'mime_type': self.mime.from_file(file_path),
-            'created_date': datetime.fromtimestamp(os.path.getctime(file_path)),
-            'modified_date': datetime.fromtimestamp(os.path.getmtime(file_path)),
+            'file_name': file_path[file_path.rfind(os.sep) + 1:],
+            'file_type': file_type,
+            'file_size': stat.st_size,
+            'mime_type': self._get_mime().from_buffer(header),
+            'created_date': datetime.fromtimestamp(stat.st_ctime),
+            'modified_date': datetime.fromtimestamp(stat.st_mtime),
         }
+    
+    def _process_image(self, file_path: str, stat: Optional[os.stat_result] = None) -> Dict[str, Any]:
+        """Extract metadata from image file."""
+        header, stat = _read_header(file_path, _EXIF_HEADER_SIZE, stat)
+        metadata = self._base_metadata(file_path, 'image', header, stat)
         
-        # Extract EXIF data
+        # Extract EXIF data, reading the whole file only if the header was not enough
         try:
-            with open(file_path, 'rb') as f:
-                tags = exifread.process_file(f, details=False)
-                
-                # Basic image info
-                if 'Image ImageWidth' in tags:
-                    metadata['width'] = int(str(tags['Image ImageWidth']))
-                if 'Image ImageLength' in tags:
-                    metadata['height'] = int(str(tags['Image ImageLength']))
-                
-                # Camera info
-                if 'Image Make' in tags:
-                    metadata['camera_make'] = str(tags['Image Make']).strip()
-                if 'Image Model' in tags:
-                    metadata['camera_model'] = str(tags['Image Model']).strip()
-                if 'EXIF LensModel' in tags:
-                    metadata['lens_model'] = str(tags['EXIF LensModel']).strip()
-                
-                # Camera settings
-                if 'EXIF FocalLength' in tags:
-                    focal = tags['EXIF FocalLength']
-                    metadata['focal_length'] = float(focal.values[0].num) / float(focal.values[0].den)
-                if 'EXIF FNumber' in tags:
-                    fnum = tags['EXIF FNumber']
-                    metadata['aperture'] = float(fnum.values[0].num) / float(fnum.values[0].den)
-                if 'EXIF ExposureTime' in tags:
-                    metadata['shutter_speed'] = str(tags['EXIF ExposureTime'])
-                if 'EXIF ISOSpeedRatings' in tags:
-                    metadata['iso'] = int(str(tags['EXIF ISOSpeedRatings']))
-                
-                # Date taken
-                if 'EXIF DateTimeOriginal' in tags:
-                    date_str = str(tags['EXIF DateTimeOriginal'])
+            try:
+                tags, gps = _read_exif(io.BytesIO(header))
+            except ValueError:
+                if stat.st_size <= len(header):
+                    raise
+                with open(file_path, 'rb') as f:
+                    tags, gps = _read_exif(f)
+            
+            for tag_id, key, convert in self.EXIF_SPEC:
+                value = tags.get(tag_id)
+                if value is not None:
                     try:
-                        metadata['date_taken'] = datetime.strptime(date_str, '%Y:%m:%d %H:%M:%S')
-                    except:
+                        metadata[key] = convert(value)
+                    except Exception:
                         pass
-                
-                # GPS data
-                gps_data = self._extract_gps_from_tags(tags)
-                if gps_data:
-                    metadata['gps_coordinates'] = gps_data
-                
+            
+            # GPS data
+            gps_data = self._extract_gps_from_tags(gps)
+            if gps_data:
+                metadata['gps_coordinates'] = gps_data
+            
         except Exception as e:
             if self.verbose:
                 print(f"Warning: Could not extract EXIF from {file_path}: {e}")
         
-        # Get basic image info with PIL
-        try:
-            with Image.open(file_path) as img:
-                if 'width' not in metadata:
-                    metadata['width'] = img.width
-                if 'height' not in metadata:
-                    metadata['height'] = img.height
-                metadata['format'] = img.format
-        except:
-            pass
+        # Get basic image info with PIL, only when the MIME type and EXIF left
+        # something unknown; the header in memory is tried before the file
+        image_format = _MIME_TO_FORMAT.get(metadata['mime_type'])
+        if image_format is None or 'width' not in metadata or 'height' not in metadata:
+            try:
+                try:
+                    img = Image.open(io.BytesIO(header))
+                except Exception:
+                    if stat.st_size <= len(header):
+                        raise
+                    img = Image.open(file_path)
+                with img:
+                    if 'width' not in metadata:
+                        metadata['width'] = img.width
+                    if 'height' not in metadata:
+                        metadata['height'] = img.height
+                    image_format = img.format
+            except:
+                pass
+        if image_format is not None:
+            metadata['format'] = image_format
         
         return metadata
     
-    def _extract_gps_from_tags(self, tags: Dict) -> Optional[Dict[str, Any]]:
-        """Extract GPS coordinates from EXIF tags."""
-        try:
-            lat = tags.get('GPS GPSLatitude')
-            lat_ref = tags.get('GPS GPSLatitudeRef')
-            lon = tags.get('GPS GPSLongitude')
-            lon_ref = tags.get('GPS GPSLongitudeRef')
-            
-            if not all([lat, lat_ref, lon, lon_ref]):
-                return None
-            
-            # Convert to decimal degrees
-            def convert_to_degrees(value):
-                d = float(value.values[0].num) / float(value.values[0].den)
-                m = float(value.values[1].num) / float(value.values[1].den)
-                s = float(value.values[2].num) / float(value.values[2].den)
-                return d + (m / 60.0) + (s / 3600.0)
-            
-            latitude = convert_to_degrees(lat)
-            longitude = convert_to_degrees(lon)
-            
-            if str(lat_ref) == 'S':
-                latitude = -latitude
-            if str(lon_ref) == 'W':
-                longitude = -longitude
+    def _extract_gps_from_tags(self, gps: Dict[int, Any]) -> Optional[_RawGPS]:
+        """
+        Collect the raw GPS rationals from the tags of an EXIF GPS IFD.
+        
+        The conversion to decimal degrees is deferred to _resolve_gps so a
+        whole batch can be converted at once. That conversion runs outside
+        any per-file error handling, so tags of the wrong type or shape are
+        rejected here: the coordinates are dropped, or just the altitude.
+        """
+        lat_ref = gps.get(0x0001)
+        lat = gps.get(0x0002)
+        lon_ref = gps.get(0x0003)
+        lon = gps.get(0x0004)
+        
+        if not (isinstance(lat_ref, str) and lat_ref and isinstance(lon_ref, str) and lon_ref):
+            return None
+        if not (_is_rationals(lat, 3) and _is_rationals(lon, 3)):
+            return None
+        
+        alt = gps.get(0x0006)
+        altitude = alt[0] if isinstance(alt, list) and _is_rationals(alt[:1], 1) else None
+        return _RawGPS(lat, lat_ref, lon, lon_ref, altitude)
+    
+    @staticmethod
+    def _resolve_gps(results: List[Dict[str, Any]]) -> None:
+        """
+        Replace raw GPS rationals in results with decimal-degree coordinates.
+        
+        Degrees, minutes and seconds for every image are divided and summed
+        as a handful of NumPy array operations rather than per-image Python
+        arithmetic. Coordinates with a zero denominator are dropped.
+        """
+        pending = [r for r in results if isinstance(r.get('gps_coordinates'), _RawGPS)]
+        if not pending:
+            return
+        raw = [r['gps_coordinates'] for r in pending]
+        
+        # Shape (images, latitude/longitude, degrees/minutes/seconds, numerator/denominator)
+        rationals = np.array([(g.latitude, g.longitude) for g in raw], dtype=np.float64)
+        nums, dens = rationals[..., 0], rationals[..., 1]
+        valid = (dens != 0).all(axis=(1, 2))
+        with np.errstate(divide='ignore', invalid='ignore'):
+            parts = nums / dens
+        degrees = parts[..., 0] + parts[..., 1] / 60.0 + parts[..., 2] / 3600.0
+        
+        refs = np.array([(g.latitude_ref, g.longitude_ref) for g in raw])
+        degrees[refs == np.array(['S', 'W'])] *= -1
+        
+        for result, gps, (latitude, longitude), ok in zip(pending, raw, degrees.tolist(), valid.tolist()):
+            if not ok:
+                del result['gps_coordinates']
+                continue
             
             gps_dict = {
                 'latitude': latitude,
                 'longitude': longitude,
-                'latitude_ref': str(lat_ref),
-                'longitude_ref': str(lon_ref)
+                'latitude_ref': gps.latitude_ref,
+                'longitude_ref': gps.longitude_ref
             }
             
             # Altitude if available
-            if 'GPS GPSAltitude' in tags:
-                alt = tags['GPS GPSAltitude']
-                gps_dict['altitude'] = float(alt.values[0].num) / float(alt.values[0].den)
-            
-            return gps_dict
+            if gps.altitude is not None and gps.altitude[1]:
+                gps_dict['altitude'] = _ratio(gps.altitude)
             
-        except Exception as e:
-            return None
+            result['gps_coordinates'] = gps_dict
     
-    def _process_video(self, file_path: str) -> Dict[str, Any]:
+    def _process_video(self, file_path: str, stat: Optional[os.stat_result] = None) -> Dict[str, Any]:
         """Extract metadata from video file."""
-        metadata = {
-            'file_path': file_path,
-            'file_name': os.path.basename(file_path),
-            'file_type': 'video',
-            'file_size': os.path.getsize(file_path),
-            'mime_type': self.mime.from_file(file_path),
-            'created_date': datetime.fromtimestamp(os.path.getctime(file_path)),
-            'modified_date': datetime.fromtimestamp(os.path.getmtime(file_path)),
-        }
+        header, stat = _read_header(file_path, stat=stat)
+        metadata = self._base_metadata(file_path, 'video', header, stat)
         
-        if mp is None:
+        if _FFPROBE is None:
+            warnings.warn(_FFPROBE_MISSING, RuntimeWarning, stacklevel=2)
             return metadata
         
         try:
-            clip = mp.VideoFileClip(file_path)
-            metadata['duration'] = clip.duration
-            metadata['width'] = clip.w
-            metadata['height'] = clip.h
-            metadata['frame_rate'] = clip.fps
+            probe = _probe_video(file_path)
+            streams = probe.get('streams', [])
+            video = next((st for st in streams if st.get('codec_type') == 'video'), None)
+            audio = next((st for st in streams if st.get('codec_type') == 'audio'), None)
             
-            if clip.audio:
-                metadata['audio_channels'] = clip.audio.nchannels
-                metadata['audio_sample_rate'] = clip.audio.fps
+            duration = probe.get('format', {}).get('duration')
+            if duration is not None:
+                metadata['duration'] = float(duration)
             
-            clip.close()
+            if video:
+                width, height = video.get('width'), video.get('height')
+                # Report display dimensions for portrait clips stored rotated
+                rotation = video.get('tags', {}).get('rotate')
+                for side_data in video.get('side_data_list', []):
+                    rotation = side_data.get('rotation', rotation)
+                if rotation is not None and abs(int(float(rotation))) in (90, 270):
+                    width, height = height, width
+                metadata['width'] = width
+                metadata['height'] = height
+                metadata['frame_rate'] = _parse_frame_rate(video.get('avg_frame_rate'))
+            
+            if audio:
+                metadata['audio_channels'] = audio.get('channels')
+                if audio.get('sample_rate'):
+                    metadata['audio_sample_rate'] = int(audio['sample_rate'])
         except Exception as e:
             if self.verbose:
                 print(f"Warning: Could not extract video metadata from {file_path}: {e}")
         
         return metadata
     
-    def _process_audio(self, file_path: str) -> Dict[str, Any]:
+    def _process_audio(self, file_path: str, stat: Optional[os.stat_result] = None) -> Dict[str, Any]:
         """Extract metadata from audio file."""
-        metadata = {
-            'file_path': file_path,
-            'file_name': os.path.basename(file_path),
-            'file_type': 'audio',
-            'file_size': os.path.getsize(file_path),
-            'mime_type': self.mime.from_file(file_path),
-            'created_date': datetime.fromtimestamp(os.path.getctime(file_path)),
-            'modified_date': datetime.fromtimestamp(os.path.getmtime(file_path)),
-        }
+        header, stat = _read_header(file_path, stat=stat)
+        metadata = self._base_metadata(file_path, 'audio', header, stat)
+        
+        ext = file_path[file_path.rfind('.'):].lower()
         
         try:
-            audiofile = eyed3.load(file_path)
-            if audiofile and audiofile.tag:
-                tag = audiofile.tag
-                metadata['title'] = tag.title
-                metadata['artist'] = tag.artist
-                metadata['album'] = tag.album
-                metadata['album_artist'] = tag.album_artist
-                metadata['genre'] = str(tag.genre) if tag.genre else None
+            if ext == '.mp3':
+                audiofile = eyed3.load(file_path)
+                if audiofile and audiofile.tag:
+                    tag = audiofile.tag
+                    metadata['title'] = tag.title
+                    metadata['artist'] = tag.artist
+                    metadata['album'] = tag.album
+                    metadata['album_artist'] = tag.album_artist
+                    metadata['genre'] = str(tag.genre) if tag.genre else None
                 
-                if tag.recording_date:
-                    metadata['year'] = tag.recording_date.year
+                    if tag.recording_date:
+                        metadata['year'] = tag.recording_date.year
                 
-                if tag.track_num:
-                    metadata['track_number'] = tag.track_num[0]
+                    if tag.track_num:
+                        metadata['track_number'] = tag.track_num[0]
+            
+                if audiofile and audiofile.info:
+                    info = audiofile.info
+                    metadata['duration'] = info.time_secs
+                    metadata['bitrate'] = info.bit_rate[1] if info.bit_rate else None
+                    metadata['sample_rate'] = info.sample_freq
             
-            if audiofile and audiofile.info:
-                info = audiofile.info
-                metadata['duration'] = info.time_secs
-                metadata['bitrate'] = info.bit_rate[1] if info.bit_rate else None
-                metadata['sample_rate'] = info.sample_freq
+            elif mutagen is not None:
+                # eyed3 only understands MP3; mutagen reads the other containers
+                audiofile = mutagen.File(file_path, easy=True)
+                if audiofile is not None and audiofile.tags:
+                    tags = audiofile.tags
+                    metadata['title'] = _first_tag(tags, 'title')
+                    metadata['artist'] = _first_tag(tags, 'artist')
+                    metadata['album'] = _first_tag(tags, 'album')
+                    metadata['album_artist'] = _first_tag(tags, 'albumartist')
+                    metadata['genre'] = _first_tag(tags, 'genre')
+                    
+                    date = _first_tag(tags, 'date')
+                    if date and date[:4].isdigit():
+                        metadata['year'] = int(date[:4])
+                    
+                    track = (_first_tag(tags, 'tracknumber') or '').split('/')[0]
+                    if track.isdigit():
+                        metadata['track_number'] = int(track)
+                
+                if audiofile is not None:
+                    info = audiofile.info
+                    bitrate = getattr(info, 'bitrate', None)
+                    metadata['duration'] = info.length
+                    # Reported in kbps, like eyed3's bit_rate
+                    metadata['bitrate'] = bitrate // 1000 if bitrate else None
+                    metadata['sample_rate'] = getattr(info, 'sample_rate', None)
         except Exception as e:
             if self.verbose:
                 print(f"Warning: Could not extract audio metadata from {file_path}: {e}")
         
         return metadata
     
-    def _process_document(self, file_path: str) -> Dict[str, Any]:
+    def _process_document(self, file_path: str, stat: Optional[os.stat_result] = None) -> Dict[str, Any]:
         """Extract metadata from document file."""
-        metadata = {
-            'file_path': file_path,
-            'file_name': os.path.basename(file_path),
-            'file_type': 'document',
-            'file_size': os.path.getsize(file_path),
-            'mime_type': self.mime.from_file(file_path),
-            'created_date': datetime.fromtimestamp(os.path.getctime(file_path)),
-            'modified_date': datetime.fromtimestamp(os.path.getmtime(file_path)),
-        }
+        header, stat = _read_header(file_path, stat=stat)
+        metadata = self._base_metadata(file_path, 'document', header, stat)
         
-        ext = Path(file_path).suffix.lower()
+        ext = file_path[file_path.rfind('.'):].lower()
         
-        if ext == '.pdf' and pdfplumber is not None:
+        if ext == '.pdf' and PdfReader is not None:
             try:
-                with pdfplumber.open(file_path) as pdf:
+                # Only the xref, trailer and page tree are read; page content stays unparsed
+                with open(file_path, 'rb') as f:
+                    pdf = PdfReader(f, strict=False)
                     metadata['page_count'] = len(pdf.pages)
                     
                     if pdf.metadata:
                         meta = pdf.metadata
-                        metadata['title'] = meta.get('Title')
-                        metadata['author'] = meta.get('Author')
-                        metadata['subject'] = meta.get('Subject')
-                        metadata['creator'] = meta.get('Creator')
-                        metadata['producer'] = meta.get('Producer')
+                        metadata['title'] = meta.title
+                        metadata['author'] = meta.author
+                        metadata['subject'] = meta.subject
+                        metadata['creator'] = meta.creator
+                        metadata['producer'] = meta.producer
                         
-                        if meta.get('CreationDate'):
+                        if meta.get('/CreationDate'):
                             try:
                                 # Parse PDF date format
-                                date_str = meta['CreationDate'].replace('D:', '').split('+')[0].split('-')[0]
+                                date_str = str(meta['/CreationDate']).replace('D:', '').split('+')[0].split('-')[0]
                                 metadata['creation_date'] = datetime.strptime(date_str[:14], '%Y%m%d%H%M%S')
                             except:
                                 pass
@@ -409,23 +948,21 @@ class MetadataAggregator:
                 if self.verbose:
                     print(f"Warning: Could not extract PDF metadata from {file_path}: {e}")
         
-        elif ext == '.docx' and DocxDocument is not None:
+        elif ext == '.docx' and etree is not None:
             try:
-                doc = DocxDocument(file_path)
-                core_props = doc.core_properties
-                
-                metadata['title'] = core_props.title
-                metadata['author'] = core_props.author
-                metadata['subject'] = core_props.subject
-                metadata['keywords'] = core_props.keywords.split(',') if core_props.keywords else None
-                metadata['creation_date'] = core_props.created
-                metadata['modification_date'] = core_props.modified
-                
-                # Count words
-                word_count = 0
-                for para in doc.paragraphs:
-                    word_count += len(para.text.split())
-                metadata['word_count'] = word_count
+                with zipfile.ZipFile(file_path) as archive:
+                    core_props = _read_docx_core_properties(archive)
+                    
+                    metadata['title'] = core_props.get('title', '')
+                    metadata['author'] = core_props.get('author', '')
+                    metadata['subject'] = core_props.get('subject', '')
+                    keywords = core_props.get('keywords')
+                    metadata['keywords'] = keywords.split(',') if keywords else None
+                    metadata['creation_date'] = core_props.get('creation_date')
+                    metadata['modification_date'] = core_props.get('modification_date')
+                    
+                    # Count words
+                    metadata['word_count'] = _count_docx_words(archive)
                 
             except Exception as e:
                 if self.verbose:
@@ -433,31 +970,76 @@ class MetadataAggregator:
         
         return metadata
     
-    def _process_generic(self, file_path: str) -> Dict[str, Any]:
+    def _process_generic(self, file_path: str, stat: Optional[os.stat_result] = None) -> Dict[str, Any]:
         """Extract basic metadata from unsupported file types."""
-        return {
-            'file_path': file_path,
-            'file_name': os.path.basename(file_path),
-            'file_type': 'unknown',
-            'file_size': os.path.getsize(file_path),
-            'mime_type': self.mime.from_file(file_path),
-            'created_date': datetime.fromtimestamp(os.path.getctime(file_path)),
-            'modified_date': datetime.fromtimestamp(os.path.getmtime(file_path)),
-        }
+        header, stat = _read_header(file_path, stat=stat)
+        return self._base_metadata(file_path, 'unknown', header, stat)
+    
+    # File type -> extractor used by _extract_file; anything else is generic
+    EXTRACTORS = {
+        'image': _process_image,
+        'video': _process_video,
+        'audio': _process_audio,
+        'document': _process_document,
+    }
     
     def process_batch(
         self, 
         file_list: List[str],
         max_workers: int = 4,
-        show_progress: bool = True
+        show_progress: bool = True,
+        process_workers: Optional[int] = None
     ) -> BatchProcessResult:
         """
         Process multiple files in parallel.
         
+        Runs process_batch_async to completion; code already inside an event
+        loop should await process_batch_async instead.
+        
         Args:
             file_list: List of file paths to process
             max_workers: Maximum number of parallel workers
             show_progress: Whether to show progress bar
+            process_workers: Maximum number of worker processes (default:
+                one per CPU)
+        
+        Returns:
+            BatchProcessResult with statistics
+        """
+        batch = self.process_batch_async(
+            file_list, max_workers=max_workers, show_progress=show_progress, process_workers=process_workers
+        )
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(batch)
+        
+        # Called from a thread with a running loop (e.g. a notebook); run on a helper thread
+        with ThreadPoolExecutor(max_workers=1) as runner:
+            return runner.submit(asyncio.run, batch).result()
+    
+    async def process_batch_async(
+        self,
+        file_list: List[str],
+        max_workers: int = 4,
+        show_progress: bool = True,
+        concurrency: int = 256,
+        process_workers: Optional[int] = None
+    ) -> BatchProcessResult:
+        """
+        Process multiple files in parallel without blocking the event loop.
+        
+        Image and document extraction runs in worker processes and everything
+        else on a thread pool. At most `concurrency` files are submitted at a
+        time, so memory stays flat however long file_list is.
+        
+        Args:
+            file_list: List of file paths to process
+            max_workers: Maximum number of worker threads
+            show_progress: Whether to show progress bar
+            concurrency: Maximum number of files in flight at once
+            process_workers: Maximum number of worker processes for image
+                and document extraction (default: one per CPU)
         
         Returns:
             BatchProcessResult with statistics
@@ -469,41 +1051,106 @@ class MetadataAggregator:
         successful = 0
         failed = 0
         
-        # Create progress bar
-        progress_bar = tqdm(
-            total=len(file_list),
-            desc="Processing files",
-            disable=not show_progress
+        # Partition by extractor cost: GIL-bound parsers go to processes,
+        # while video/audio probing and unknown files stay on threads.
+        # Files unchanged since they were cached skip extraction entirely
+        cpu_bound = []
+        io_bound = []
+        for file_path in file_list:
+            stat = self._scan_stats.pop(file_path, None)
+            if self._cache is not None:
+                stat, cached = self._cache_get(file_path, stat)
+                if cached is not None:
+                    self.results.append(cached)
+                    continue
+            if _FORK_CONTEXT is not None and self.detect_file_type(file_path) in self.CPU_BOUND_TYPES:
+                cpu_bound.append((file_path, stat))
+            else:
+                io_bound.append((file_path, stat))
+        successful = len(self.results)
+        fresh = []
+        
+        queue = iter(
+            [(file_path, stat, True) for file_path, stat in cpu_bound]
+            + [(file_path, stat, False) for file_path, stat in io_bound]
         )
+        loop = asyncio.get_running_loop()
         
-        with ThreadPoolExecutor(max_workers=max_workers) as executor:
-            # Submit all tasks
-            future_to_file = {
-                executor.submit(self.process_file, file_path): file_path 
-                for file_path in file_list
-            }
+        with ExitStack() as stack:
+            process_pool = None
+            if cpu_bound:
+                process_pool = stack.enter_context(ProcessPoolExecutor(
+                    max_workers=min(process_workers or os.cpu_count() or 1, len(cpu_bound)),
+                    mp_context=_FORK_CONTEXT
+                ))
+                # A first task makes the pool fork all its workers now, before
+                # tqdm's monitor thread and the worker threads below exist
+                process_pool.submit(os.getpid).result()
             
-            # Process completed tasks
-            for future in as_completed(future_to_file):
-                file_path = future_to_file[future]
-                try:
-                    result = future.result()
-                    if result:
-                        self.results.append(result)
-                        successful += 1
+            # Create progress bar; it is advanced in batches so tqdm's lock and
+            # refresh bookkeeping are not paid on every completed file
+            progress_bar = stack.enter_context(tqdm(
+                total=len(file_list),
+                desc="Processing files",
+                disable=not show_progress,
+                mininterval=0.25,
+                miniters=max(1, len(file_list) // 200)
+            ))
+            progress_bar.update(successful)
+            update_every = max(1, min(64, len(file_list) // 100))
+            completed = 0
+            
+            executor = stack.enter_context(ThreadPoolExecutor(max_workers=max_workers))
+            
+            # Keep at most `concurrency` files in flight, topping up as they finish
+            pending = {}
+            while True:
+                for file_path, stat, in_worker in itertools.islice(queue, concurrency - len(pending)):
+                    if in_worker:
+                        future = loop.run_in_executor(process_pool, _process_in_worker, file_path, stat, self.verbose)
                     else:
-                        failed += 1
-                except Exception as e:
-                    failed += 1
-                    self.errors.append({
-                        'file': file_path,
-                        'error': str(e),
-                        'type': 'execution_error'
-                    })
+                        future = loop.run_in_executor(executor, self._extract_file, file_path, stat)
+                    pending[future] = (file_path, stat, in_worker)
+                
+                if not pending:
+                    break
+                done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
                 
-                progress_bar.update(1)
+                # Process completed tasks
+                for future in done:
+                    file_path, stat, in_worker = pending.pop(future)
+                    try:
+                        if in_worker:
+                            result, errors = future.result()
+                            self.errors.extend(errors)
+                        else:
+                            result = future.result()
+                        if result:
+                            self.results.append(result)
+                            successful += 1
+                            if self._cache is not None and stat is not None:
+                                fresh.append((file_path, stat, result))
+                        else:
+                            failed += 1
+                    except Exception as e:
+                        failed += 1
+                        self.errors.append({
+                            'file': file_path,
+                            'error': str(e),
+                            'type': 'execution_error'
+                        })
+                    
+                    completed += 1
+                    if completed == update_every:
+                        progress_bar.update(completed)
+                        completed = 0
+            
+            progress_bar.update(completed)
         
-        progress_bar.close()
+        # Convert GPS for the whole batch at once, before anything is cached
+        self._resolve_gps(self.results)
+        if fresh:
+            self._cache_put(fresh)
         
         processing_time = time.time() - start_time
         
@@ -542,15 +1189,26 @@ class MetadataAggregator:
             format: Export format ('json' or 'csv')
         """
         if format == 'json':
-            with open(output_path, 'w') as f:
-                json.dump(self.results, f, indent=2, default=str)
+            if orjson is not None:
+                # Datetimes go through default=str so the output matches the json fallback
+                data = orjson.dumps(
+                    self.results,
+                    default=str,
+                    option=orjson.OPT_INDENT_2 | orjson.OPT_PASSTHROUGH_DATETIME
+                )
+                with open(output_path, 'wb') as f:
+                    f.write(data)
+            else:
+                with open(output_path, 'w') as f:
+                    json.dump(self.results, f, indent=2, default=str)
         elif format == 'csv':
-            try:
-                import pandas as pd
-                df = pd.DataFrame(self.results)
-                df.to_csv(output_path, index=False)
-            except ImportError:
-                raise ImportError("pandas is required for CSV export")
+            # Stream rows straight out; columns are the union of keys in
+            # first-seen order, as the DataFrame used to build them
+            fieldnames = list(dict.fromkeys(key for result in self.results for key in result))
+            with open(output_path, 'w', newline='', encoding='utf-8') as f:
+                writer = csv.DictWriter(f, fieldnames=fieldnames, lineterminator='\n')
+                writer.writeheader()
+                writer.writerows(self.results)
         else:
             raise ValueError(f"Unsupported format: {format}")
         
@@ -558,6 +1216,29 @@ class MetadataAggregator:
             print(f"Results exported to {output_path}")
 
 
+# Aggregator owned by the current worker process, created on its first task
+_worker_aggregator: Optional[MetadataAggregator] = None
+
+
+def _process_in_worker(
+    file_path: str,
+    stat: Optional[os.stat_result],
+    verbose: bool
+) -> Tuple[Optional[Dict[str, Any]], List[Dict[str, str]]]:
+    """
+    Process a single file inside a process_batch worker process.
+    
+    Errors are returned alongside the result because the parent cannot see
+    the worker aggregator's error list.
+    """
+    global _worker_aggregator
+    if _worker_aggregator is None:
+        _worker_aggregator = MetadataAggregator(verbose=verbose)
+    _worker_aggregator.errors = []
+    result = _worker_aggregator._extract_file(file_path, stat)
+    return result, _worker_aggregator.errors
+
+
 if __name__ == "__main__":
     # Example usage
     import argparse
@@ -569,11 +1250,12 @@ if __name__ == "__main__":
     parser.add_argument("--output", "-o", help="Output file path")
     parser.add_argument("--format", "-f", choices=['json', 'csv'], default='json', help="Output format")
     parser.add_argument("--workers", "-w", type=int, default=4, help="Number of parallel workers")
+    parser.add_argument("--cache", "-c", help="SQLite file caching metadata between runs")
     
     args = parser.parse_args()
     
     # Create aggregator
-    aggregator = MetadataAggregator(verbose=True)
+    aggregator = MetadataAggregator(verbose=True, cache_path=args.cache)
     
     # Scan directory
     files = aggregator.scan_directory(args.path, recursive=args.recursive, file_types=args.types)
@@ -584,6 +1266,7 @@ if __name__ == "__main__":
     
     # Process files
     result = aggregator.process_batch(files, max_workers=args.workers)
+    aggregator.close()
     
     # Export if requested
     if args.output:
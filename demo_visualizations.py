@@ -10,11 +10,17 @@ This script will:
 5. Open them in your web browser
 
 Usage:
-    python demo_visualizations.py
+    python demo_visualizations.py [--live]
+    
+    --live  Chart pages poll for re-runs of this script and redraw in place
 """
 
 import sys
 import os
+import io
+import gzip
+import shutil
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 import webbrowser
 import time
@@ -22,6 +28,8 @@ import time
 # Add project root to path
 sys.path.insert(0, str(Path(__file__).parent))
 
+live = '--live' in sys.argv[1:]
+
 print("=" * 70)
 print("  Exif Metadata Visualization Demo")
 print("=" * 70)
@@ -38,14 +46,44 @@ if not media_dir.exists():
     print(f"   Then run this script again.")
     sys.exit(0)
 
-# Count files
-image_exts = ['.jpg', '.jpeg', '.png', '.gif', '.bmp', '.tiff']
-video_exts = ['.mp4', '.avi', '.mov', '.mkv']
-all_files = []
+# Count files in a single walk, matching extensions case-insensitively
+media_exts = frozenset({
+    '.jpg', '.jpeg', '.png', '.gif', '.bmp', '.tiff',
+    '.mp4', '.avi', '.mov', '.mkv'
+})
+
+
+def iter_media(root):
+    """Yield paths of files under root with a media extension."""
+    for dirpath, _, names in os.walk(root):
+        for name in names:
+            if os.path.splitext(name)[1].lower() in media_exts:
+                yield os.path.join(dirpath, name)
+
 
-for ext in image_exts + video_exts:
-    all_files.extend(list(media_dir.rglob(f"*{ext}")))
-    all_files.extend(list(media_dir.rglob(f"*{ext.upper()}")))
+def is_rotational(path):
+    """Return True if path is on a spinning disk (Linux sysfs; False if unknown)."""
+    if sys.platform != 'linux':
+        return False
+    dev = os.stat(path).st_dev
+    sys_dir = f"/sys/dev/block/{os.major(dev)}:{os.minor(dev)}"
+    # Partitions have no queue/ of their own; it lives on the parent disk
+    for block_dir in (sys_dir, os.path.join(sys_dir, "..")):
+        try:
+            with open(os.path.join(block_dir, "queue", "rotational")) as f:
+                return f.read().strip() == "1"
+        except OSError:
+            continue
+    return False
+
+
+def precompress(path):
+    """Write a gzip copy beside path for static servers that serve .gz files."""
+    with open(path, 'rb') as src, gzip.open(f"{path}.gz", 'wb', compresslevel=6) as dst:
+        shutil.copyfileobj(src, dst)
+
+
+all_files = list(iter_media(media_dir))
 
 if len(all_files) == 0:
     print(f"⚠️  No media files found in {media_dir.absolute()}")
@@ -66,8 +104,17 @@ try:
         print("⚠️  No supported files found")
         sys.exit(0)
     
+    # Scale I/O workers with cores and batch size; seeks make concurrency hurt
+    # on HDDs, so there both the threads and the extraction processes are capped
+    workers = min(os.cpu_count() or 4, max(4, len(files) // 50))
+    process_workers = None
+    if is_rotational(media_dir):
+        workers = process_workers = min(workers, 2)
+    
     print(f"  Processing {len(files)} files...")
-    result = aggregator.process_batch(files, max_workers=4, show_progress=True)
+    result = aggregator.process_batch(
+        files, max_workers=workers, show_progress=True, process_workers=process_workers
+    )
     
     print(f"\n✓ Processed {result.successful} files successfully")
     if result.failed > 0:
@@ -84,14 +131,14 @@ try:
     
     db = MetadataDatabase("data/metadata.db")
     
-    # Clear old data
+    # Replace old data with the new results in a single transaction
     old_count = db.get_statistics().get('total_files', 0)
-    if old_count > 0:
-        print(f"  Clearing {old_count} old records...")
-        db.delete_all()
-    
-    # Insert new data
-    db.insert_batch(aggregator.get_results())
+    with db.bulk_transaction():
+        if old_count > 0:
+            print(f"  Clearing {old_count} old records...")
+            db.delete_all()
+        
+        db.insert_batch(aggregator.get_results())
     
     stats = db.get_statistics()
     print(f"✓ Stored {stats['total_files']} files in database")
@@ -107,18 +154,22 @@ try:
     from analysis.statistical_analyzer import StatisticalAnalyzer
     import pandas as pd
     
-    # Get all data
-    df = db.export_to_dataframe()
-    
-    if len(df) == 0:
+    # Counts come from the SQL aggregates in Step 3; only load rows if there are any
+    if stats['total_files'] == 0:
         print("⚠️  No data to analyze")
         sys.exit(0)
     
+    # Get all data, as Arrow-backed columns when pandas 2.0+ and pyarrow are installed
+    try:
+        df = db.export_to_dataframe(dtype_backend='pyarrow')
+    except (ImportError, TypeError):
+        df = db.export_to_dataframe()
+    
     analyzer = StatisticalAnalyzer(df)
     report = analyzer.get_summary_report()
     
     print(f"✓ Analysis complete")
-    print(f"  File types: {report['overview'].get('file_type_distribution', {})}")
+    print(f"  File types: {stats['files_by_type']}")
     
     # Save report
     analyzer.export_report("exports/analysis_report.json")
@@ -142,62 +193,73 @@ try:
     output_dir.mkdir(parents=True, exist_ok=True)
     
     charts_created = []
+    pending = []  # (figure, path) pairs, written together at the end
+    
+    # Column presence and non-null checks, each column scanned once; the
+    # categorical counts are shared by the charts and the checks
+    cols = set(df.columns)
+    counts = {col: df[col].value_counts() for col in ('file_type', 'camera_model') if col in cols}
+    has_data = {
+        col: bool(df[col].notna().any())
+        for col in ('width', 'height', 'iso')
+        if col in cols
+    }
+    if 'camera_model' in counts:
+        has_data['camera_model'] = len(counts['camera_model']) > 0
     
     # 1. File type distribution
-    if 'file_type' in df.columns:
+    if 'file_type' in cols:
         print("  Creating file type distribution chart...")
-        fig = viz.create_pie_chart('file_type', 'File Type Distribution')
+        fig = viz.create_pie_chart('file_type', 'File Type Distribution', counts=counts['file_type'])
         filepath = output_dir / "01_file_types.html"
-        fig.write_html(str(filepath))
-        charts_created.append(filepath)
+        pending.append((fig, filepath))
+        charts_created.append((filepath, "📁", "File Types"))
     
     # 2. Camera distribution (if images present)
-    if 'camera_model' in df.columns and df['camera_model'].notna().any():
+    if has_data.get('camera_model'):
         print("  Creating camera distribution chart...")
-        fig = viz.create_bar_chart('camera_model', 'Top Cameras Used', top_n=10)
+        fig = viz.create_bar_chart('camera_model', 'Top Cameras Used', top_n=10, counts=counts['camera_model'])
         filepath = output_dir / "02_cameras.html"
-        fig.write_html(str(filepath))
-        charts_created.append(filepath)
+        pending.append((fig, filepath))
+        charts_created.append((filepath, "📷", "Camera Models"))
     
     # 3. Timeline
-    if 'created_date' in df.columns:
+    if 'created_date' in cols:
         print("  Creating timeline chart...")
         fig = viz.create_timeline('created_date', 'Files Created Over Time', group_by='day')
         filepath = output_dir / "03_timeline.html"
-        fig.write_html(str(filepath))
-        charts_created.append(filepath)
+        pending.append((fig, filepath))
+        charts_created.append((filepath, "📅", "Timeline"))
     
     # 4. File size distribution
-    if 'file_size' in df.columns:
+    if 'file_size' in cols:
         print("  Creating file size distribution...")
-        df_temp = df.copy()
-        df_temp['file_size_mb'] = df_temp['file_size'] / (1024 * 1024)
-        viz_temp = ChartGenerator(df_temp, theme='plotly_dark')
-        fig = viz_temp.create_histogram('file_size_mb', 'File Size Distribution (MB)', bins=20)
+        size_mb = df['file_size'].rename('file_size_mb') / (1024 * 1024)
+        fig = viz.create_histogram(size_mb, 'File Size Distribution (MB)', bins=20)
         filepath = output_dir / "04_file_sizes.html"
-        fig.write_html(str(filepath))
-        charts_created.append(filepath)
+        pending.append((fig, filepath))
+        charts_created.append((filepath, "💾", "File Sizes"))
     
     # 5. Resolution scatter plot (if available)
-    if 'width' in df.columns and 'height' in df.columns:
-        if df[['width', 'height']].notna().any().any():
+    if 'width' in has_data and 'height' in has_data:
+        if has_data['width'] or has_data['height']:
             print("  Creating resolution distribution...")
             fig = viz.create_scatter_plot(
                 'width', 'height',
                 'Image Resolution Distribution',
-                color_field='file_type' if 'file_type' in df.columns else None
+                color_field='file_type' if 'file_type' in cols else None
             )
             filepath = output_dir / "05_resolutions.html"
-            fig.write_html(str(filepath))
-            charts_created.append(filepath)
+            pending.append((fig, filepath))
+            charts_created.append((filepath, "🖼️", "Resolutions"))
     
     # 6. ISO distribution (if available)
-    if 'iso' in df.columns and df['iso'].notna().any():
+    if has_data.get('iso'):
         print("  Creating ISO distribution...")
         fig = viz.create_histogram('iso', 'ISO Settings Distribution', bins=15)
         filepath = output_dir / "06_iso_distribution.html"
-        fig.write_html(str(filepath))
-        charts_created.append(filepath)
+        pending.append((fig, filepath))
+        charts_created.append((filepath, "⚙️", "ISO Settings"))
     
     # 7. Metadata completeness heatmap
     print("  Creating metadata completeness heatmap...")
@@ -208,8 +270,34 @@ try:
     if important_fields:
         fig = viz.create_heatmap(important_fields, 'Metadata Completeness')
         filepath = output_dir / "07_completeness.html"
-        fig.write_html(str(filepath))
-        charts_created.append(filepath)
+        pending.append((fig, filepath))
+        charts_created.append((filepath, "✅", "Completeness"))
+    
+    # plotly.js is written once beside the charts instead of embedded in
+    # each file; copying it up front keeps the writers below from racing on it
+    plotly_js = output_dir / "plotly.min.js"
+    if not plotly_js.exists():
+        from plotly.offline import get_plotlyjs
+        plotly_js.write_text(get_plotlyjs(), encoding='utf-8')
+    if not Path(f"{plotly_js}.gz").exists():
+        precompress(plotly_js)
+    
+    html_options = dict(include_plotlyjs='directory', full_html=True, config={'responsive': True}, validate=False)
+    
+    def write_chart(item):
+        fig, filepath = item
+        if live:
+            # Open pages poll the chart's .js sidecar and redraw when a re-run changes it
+            ChartGenerator.write_live_html(fig, filepath, **html_options)
+            precompress(filepath.with_suffix('.js'))
+        else:
+            fig.write_html(str(filepath), **html_options)
+        precompress(filepath)
+    
+    # The files are independent, so write them concurrently; the figures were
+    # validated when ChartGenerator built them, so writing skips that step
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+        list(executor.map(write_chart, pending))
     
     print(f"\n✓ Created {len(charts_created)} visualizations")
     
@@ -224,13 +312,15 @@ print("\nStep 6: Creating dashboard page...")
 try:
     index_html = output_dir / "index.html"
     
-    with open(index_html, 'w') as f:
+    # Build the page in memory and write it out once
+    with io.StringIO() as f:
         f.write("""<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
     <title>EXIF Metadata Dashboard</title>
+    <link rel="preload" href="plotly.min.js" as="script">
     <style>
         * { margin: 0; padding: 0; box-sizing: border-box; }
         body {
@@ -365,26 +455,16 @@ try:
     <div class="dashboard">
 """)
         
-        chart_info = [
-            ("01_file_types.html", "📁", "File Types"),
-            ("02_cameras.html", "📷", "Camera Models"),
-            ("03_timeline.html", "📅", "Timeline"),
-            ("04_file_sizes.html", "💾", "File Sizes"),
-            ("05_resolutions.html", "🖼️", "Resolutions"),
-            ("06_iso_distribution.html", "⚙️", "ISO Settings"),
-            ("07_completeness.html", "✅", "Completeness"),
-        ]
-        
-        for filename, icon, title in chart_info:
-            if (output_dir / filename).exists():
-                f.write(f"""
+        for filepath, icon, title in charts_created:
+            filename = filepath.name
+            f.write(f"""
         <div class="chart-card">
             <div class="chart-header">
                 <div class="chart-title">{icon} {title}</div>
                 <a href="{filename}" target="_blank" class="chart-icon" title="Open in new tab">⤢</a>
             </div>
             <div class="chart-body">
-                <iframe src="{filename}" title="{title}"></iframe>
+                <iframe src="{filename}" title="{title}" loading="lazy"></iframe>
             </div>
         </div>
 """)
@@ -394,6 +474,8 @@ try:
 </body>
 </html>
 """)
+        index_html.write_text(f.getvalue(), encoding='utf-8')
+    precompress(index_html)
     
     print(f"✓ Index page created: {index_html}")
     
@@ -420,8 +502,8 @@ except:
 
 print()
 print("You can also open individual charts:")
-for chart in charts_created:
-    print(f"  • {chart.name}")
+for filepath, _, _ in charts_created:
+    print(f"  • {filepath.name}")
 
 print()
 print("=" * 70)
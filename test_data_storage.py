@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Database export test with sample metadata.
+Checks that export_to_dataframe returns the same data on every code path.
+
+Usage:
+    python test_data_storage.py
+"""
+
+import sqlite3
+import sys
+import tempfile
+from pathlib import Path
+
+# Add project to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from core import data_storage
+from core.data_storage import MetadataDatabase
+
+
+def _null_leading_images(db_dir, n_files=3000, n_plain=2500):
+    """Database of images whose TEXT/REAL camera columns are NULL for the first n_plain rows."""
+    db = MetadataDatabase(str(Path(db_dir) / 'metadata.db'))
+    rows = []
+    for i in range(n_files):
+        metadata = {
+            'file_path': f'/media/{i:05d}.jpg', 'file_name': f'{i:05d}.jpg',
+            'file_type': 'image', 'file_size': 1000 + i
+        }
+        # Screenshots first, camera JPEGs after them
+        if i >= n_plain:
+            metadata.update(camera_make='Canon', camera_model='EOS R5', focal_length=35.5, aperture=2.8)
+        rows.append(metadata)
+    db.insert_batch(rows)
+    return db
+
+
+def test_export_null_leading_columns():
+    """A column that is NULL in the first rows and filled later still exports."""
+    with tempfile.TemporaryDirectory() as db_dir:
+        db = _null_leading_images(db_dir)
+        for dtype_backend in (None, 'pyarrow'):
+            df = db.export_to_dataframe('image', dtype_backend=dtype_backend)
+            assert len(df) == 3000
+            assert df['camera_make'].notna().sum() == 500
+            assert df['focal_length'].notna().sum() == 500
+            assert df['focal_length'].dropna().astype(float).eq(35.5).all()
+        db.close()
+
+
+def test_export_falls_back_to_sqlite3():
+    """A driver error on the ADBC path falls back to pd.read_sql_query."""
+    if not data_storage.ADBC_AVAILABLE:
+        return
+    
+    def fail(*args, **kwargs):
+        raise OSError("[SQLite] Type mismatch in column 12: expected INT64 but got STRING/BINARY")
+    
+    with tempfile.TemporaryDirectory() as db_dir:
+        db = _null_leading_images(db_dir, n_files=20, n_plain=10)
+        db._export_arrow = fail
+        df = db.export_to_dataframe('image')
+        assert len(df) == 20
+        assert df['camera_make'].notna().sum() == 10
+        db.close()
+
+
+
+def test_legacy_keywords_backfilled():
+    """Comma-joined keywords from before document_keywords existed are found by keyword."""
+    with tempfile.TemporaryDirectory() as db_dir:
+        db_path = str(Path(db_dir) / 'metadata.db')
+        db = MetadataDatabase(db_path)
+        db.insert_file({
+            'file_path': '/docs/a.pdf', 'file_name': 'a.pdf', 'file_type': 'document',
+            'file_size': 10, 'keywords': ['x', 'y']
+        })
+        db.close()
+        
+        # Roll the database back to how older versions stored keywords
+        conn = sqlite3.connect(db_path)
+        conn.execute("UPDATE document_metadata SET keywords = 'x,y'")
+        conn.execute("DELETE FROM document_keywords")
+        conn.execute("PRAGMA user_version = 1")
+        conn.commit()
+        conn.close()
+        
+        db = MetadataDatabase(db_path)
+        assert [row['file_path'] for row in db.get_files_by_keyword('y')] == ['/docs/a.pdf']
+        assert db.export_to_dataframe('document')['keywords'].tolist() == ['["x", "y"]']
+        db.close()
+
+
+if __name__ == '__main__':
+    failed = 0
+    for name, test in list(globals().items()):
+        if name.startswith('test_') and callable(test):
+            try:
+                test()
+                print(f"✓ {name}")
+            except Exception as e:
+                failed += 1
+                print(f"✗ {name}: {e!r}")
+    sys.exit(1 if failed else 0)
@@ -2,9 +2,13 @@
 """
 Quick visualization test with sample data.
 Run this to see visualizations without needing real files!
+
+Usage:
+    python test_visualizations.py [n_files]
 """
 
 import sys
+import io
 from pathlib import Path
 
 # Add project to path
@@ -23,14 +27,14 @@ try:
     
     np.random.seed(42)
     
-    # Generate realistic sample metadata
-    n_files = 150
+    # Generate realistic sample metadata (pass a larger count to stress-test)
+    n_files = int(sys.argv[1]) if len(sys.argv) > 1 else 150
     
     cameras = ['Canon EOS 5D Mark IV', 'Nikon D850', 'Sony A7III', 'iPhone 13 Pro', 'Canon EOS R5']
     file_types = ['image', 'video']
     
     data = pd.DataFrame({
-        'file_name': [f'IMG_{i:04d}.jpg' for i in range(n_files)],
+        'file_name': np.char.add(np.char.add('IMG_', np.char.zfill(np.arange(n_files).astype(str), 4)), '.jpg'),
         'file_type': np.random.choice(file_types, n_files, p=[0.85, 0.15]),
         'file_size': np.random.randint(2_000_000, 25_000_000, n_files),
         'camera_make': np.random.choice(['Canon', 'Nikon', 'Sony', 'Apple'], n_files),
@@ -71,6 +75,14 @@ except ImportError as e:
 output_dir = Path("exports/test_visualizations")
 output_dir.mkdir(parents=True, exist_ok=True)
 
+# plotly.js is written once as output_dir/plotly.min.js instead of into every chart
+html_options = {
+    'include_plotlyjs': 'directory',
+    'full_html': True,
+    'config': {'responsive': True},
+    'validate': False,  # figures come from ChartGenerator, already validated
+}
+
 # Create charts
 print("\nCreating visualizations...")
 charts_created = []
@@ -80,51 +92,50 @@ try:
     print("  [1/7] File type distribution...")
     fig = viz.create_pie_chart('file_type', 'File Type Distribution')
     filepath = output_dir / "01_file_types.html"
-    fig.write_html(str(filepath))
+    fig.write_html(str(filepath), **html_options)
     charts_created.append(("File Types", filepath))
     
     # 2. Camera bar chart
     print("  [2/7] Camera distribution...")
     fig = viz.create_bar_chart('camera_model', 'Camera Models Used', top_n=10)
     filepath = output_dir / "02_cameras.html"
-    fig.write_html(str(filepath))
+    fig.write_html(str(filepath), **html_options)
     charts_created.append(("Camera Models", filepath))
     
     # 3. Timeline
     print("  [3/7] Timeline...")
     fig = viz.create_timeline('created_date', 'Files Over Time', group_by='week')
     filepath = output_dir / "03_timeline.html"
-    fig.write_html(str(filepath))
+    fig.write_html(str(filepath), **html_options)
     charts_created.append(("Timeline", filepath))
     
     # 4. File size histogram
     print("  [4/7] File size distribution...")
-    data['file_size_mb'] = data['file_size'] / (1024 * 1024)
-    viz_temp = ChartGenerator(data, theme='plotly_dark')
-    fig = viz_temp.create_histogram('file_size_mb', 'File Size Distribution (MB)', bins=25)
+    size_mb = data['file_size'].rename('file_size_mb') / (1024 * 1024)
+    fig = viz.create_histogram(size_mb, 'File Size Distribution (MB)', bins=25)
     filepath = output_dir / "04_file_sizes.html"
-    fig.write_html(str(filepath))
+    fig.write_html(str(filepath), **html_options)
     charts_created.append(("File Sizes", filepath))
     
     # 5. Resolution scatter
     print("  [5/7] Resolution distribution...")
     fig = viz.create_scatter_plot('width', 'height', 'Resolution Distribution', color_field='file_type')
     filepath = output_dir / "05_resolution.html"
-    fig.write_html(str(filepath))
+    fig.write_html(str(filepath), **html_options)
     charts_created.append(("Resolution", filepath))
     
     # 6. ISO histogram
     print("  [6/7] ISO distribution...")
     fig = viz.create_histogram('iso', 'ISO Settings Distribution', bins=15)
     filepath = output_dir / "06_iso.html"
-    fig.write_html(str(filepath))
+    fig.write_html(str(filepath), **html_options)
     charts_created.append(("ISO Settings", filepath))
     
     # 7. Aperture box plot
     print("  [7/7] Aperture distribution...")
     fig = viz.create_box_plot('aperture', group_by='camera_model', title='Aperture by Camera')
     filepath = output_dir / "07_aperture.html"
-    fig.write_html(str(filepath))
+    fig.write_html(str(filepath), **html_options)
     charts_created.append(("Aperture", filepath))
     
     print(f"\n✓ Created {len(charts_created)} visualizations!")
@@ -139,13 +150,15 @@ except Exception as e:
 print("\nCreating dashboard page...")
 index_path = output_dir / "index.html"
 
-with open(index_path, 'w') as f:
+# Build the page in memory and write it out once
+with io.StringIO() as f:
     f.write("""<!DOCTYPE html>
 <html>
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
     <title>EXIF Metadata Dashboard</title>
+    <link rel="preload" href="plotly.min.js" as="script">
     <style>
         * {
             margin: 0;
@@ -288,7 +301,7 @@ with open(index_path, 'w') as f:
                 <a href="{filename}" target="_blank" class="chart-icon" title="Open in new tab">⤢</a>
             </div>
             <div class="chart-body">
-                <iframe src="{filename}" title="{title}"></iframe>
+                <iframe src="{filename}" title="{title}" loading="lazy"></iframe>
             </div>
         </div>
 """)
@@ -298,6 +311,7 @@ with open(index_path, 'w') as f:
 </body>
 </html>
 """)
+    index_path.write_text(f.getvalue(), encoding='utf-8')
 
 print(f"✓ Dashboard created: {index_path}")
 
@@ -7,19 +7,30 @@ including pie charts, bar charts, timelines, scatter plots, histograms, and more
 """
 
 from __future__ import annotations
-from typing import Dict, List, Any, Optional, Union, TYPE_CHECKING
+from typing import Dict, List, Any, Callable, Optional, Union, TYPE_CHECKING
+from functools import partial
 import os
+import re
 from pathlib import Path
 
 try:
+    import numpy as np
     import pandas as pd
     import plotly.graph_objects as go
     import plotly.express as px
+    import plotly.io as pio
     from plotly.subplots import make_subplots
     PLOTLY_AVAILABLE = True
 except ImportError:
     PLOTLY_AVAILABLE = False
 
+from analysis.statistical_analyzer import categorize
+
+if PLOTLY_AVAILABLE:
+    # New figures pick up the default template without the deep copy an
+    # explicit template= costs per figure, so register the dark theme once
+    pio.templates.default = 'plotly_dark'
+
 try:
     import matplotlib.pyplot as plt
     import seaborn as sns
@@ -27,6 +38,124 @@ try:
 except ImportError:
     MATPLOTLIB_AVAILABLE = False
 
+# Point budgets above which charts are reduced before plotting
+_MAX_TIMELINE_POINTS = 5000
+_MAX_SCATTER_POINTS = 20_000
+
+# Point count above which line/marker traces are drawn with WebGL instead of SVG
+_WEBGL_MIN_POINTS = 1000
+
+# EXIF DateTime values ('YYYY:MM:DD HH:MM:SS'), which pandas cannot infer a format for
+_EXIF_DATETIME = re.compile(r'\d{4}:\d{2}:\d{2} \d{2}:\d{2}:\d{2}$')
+_EXIF_DATETIME_FORMAT = '%Y:%m:%d %H:%M:%S'
+
+
+# Runs inside a chart page written by write_live_html: reloads the figure's
+# sidecar script every {poll_ms} ms and redraws in place when it changed.
+# file:// pages cannot fetch(), so the figure arrives as a script instead
+_LIVE_UPDATE_JS = """
+var gd = document.getElementById('{plot_id}');
+var last = null;
+window.updateFigure = function (fig) {
+    var json = JSON.stringify(fig);
+    if (last !== null && json !== last) {
+        Plotly.react(gd, fig.data, fig.layout);
+    }
+    last = json;
+};
+setInterval(function () {
+    var script = document.createElement('script');
+    script.src = '{sidecar}?t=' + Date.now();
+    script.onload = script.onerror = function () { script.remove(); };
+    document.head.appendChild(script);
+}, {poll_ms});
+"""
+
+
+def _scatter_cls(n_points: int):
+    """Return the Scatter trace class for n_points: Scattergl past _WEBGL_MIN_POINTS."""
+    return go.Scattergl if n_points > _WEBGL_MIN_POINTS else go.Scatter
+
+
+def _to_datetimes(values: pd.Series) -> pd.Series:
+    """
+    Parse a column as datetimes (unparseable values as NaT) on a vectorized path.
+    
+    Datetime columns are returned as they are and numbers are read as epoch
+    seconds, as the database stores them. Strings are parsed with the format
+    of the first value when it is an EXIF timestamp; otherwise pandas infers
+    it. Without a usable format pandas parses each value with dateutil.
+    Categoricals parse each distinct value once.
+    
+    Args:
+        values: Column to parse
+    
+    Returns:
+        Series of datetimes with the same index
+    """
+    if pd.api.types.is_datetime64_any_dtype(values):
+        return values
+    
+    if isinstance(values.dtype, pd.CategoricalDtype):
+        categories = _to_datetimes(pd.Series(values.cat.categories))
+        if categories.dtype.kind == 'M':
+            # Code -1 (null) picks the NaT appended after the parsed categories
+            dates = np.append(categories.to_numpy(), np.datetime64('NaT'))[values.cat.codes.to_numpy()]
+            return pd.Series(dates, index=values.index, name=values.name)
+        values = values.astype(object)
+    
+    if pd.api.types.is_numeric_dtype(values) and not pd.api.types.is_bool_dtype(values):
+        return pd.to_datetime(values, unit='s', errors='coerce')
+    
+    first = values.first_valid_index()
+    if first is not None and isinstance(values[first], str) and _EXIF_DATETIME.match(values[first]):
+        return pd.to_datetime(values, format=_EXIF_DATETIME_FORMAT, errors='coerce')
+    
+    return pd.to_datetime(values, errors='coerce')
+
+
+def _lttb(x: np.ndarray, y: np.ndarray, n_out: int) -> np.ndarray:
+    """
+    Pick n_out indices that keep the visual shape of a line (Largest-Triangle-Three-Buckets).
+    
+    Args:
+        x: Ascending x values
+        y: y values
+        n_out: Number of points to keep (first and last are always kept)
+    
+    Returns:
+        Sorted array of selected indices
+    """
+    n = len(x)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+    
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    
+    # Interior points split into n_out - 2 buckets; each keeps the point forming
+    # the largest triangle with the previous pick and the next bucket's average
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.int64)
+    indices = np.empty(n_out, dtype=np.int64)
+    indices[0] = 0
+    indices[-1] = n - 1
+    
+    prev = 0
+    for i in range(n_out - 2):
+        start, end = edges[i], edges[i + 1]
+        next_start, next_end = (edges[i + 1], edges[i + 2]) if i + 2 < len(edges) else (n - 1, n)
+        avg_x = x[next_start:next_end].mean()
+        avg_y = y[next_start:next_end].mean()
+        
+        area = np.abs(
+            (x[prev] - avg_x) * (y[start:end] - y[prev])
+            - (x[prev] - x[start:end]) * (avg_y - y[prev])
+        )
+        prev = start + int(area.argmax())
+        indices[i + 1] = prev
+    
+    return indices
+
 
 class ChartGenerator:
     """
@@ -35,27 +164,91 @@ class ChartGenerator:
     Supports both interactive (Plotly) and static (Matplotlib) charts.
     """
     
-    def __init__(self, data: pd.DataFrame, theme: str = 'plotly_dark'):
+    def __init__(self, data: pd.DataFrame, theme: Optional[str] = None):
         """
         Initialize the chart generator.
         
         Args:
             data: pandas DataFrame with metadata
-            theme: Plotly theme ('plotly', 'plotly_dark', 'plotly_white')
+            theme: Plotly theme ('plotly', 'plotly_dark', 'plotly_white');
+                None uses the default template (plotly_dark)
         """
         if not PLOTLY_AVAILABLE:
             raise ImportError("plotly is required for ChartGenerator")
         
-        self.data = data
-        self.theme = theme
+        self.data = categorize(data)
+        self.theme = theme or pio.templates.default
+        # Only pass template= when it differs from the default figures already get
+        self._template = {} if self.theme == pio.templates.default else {'template': self.theme}
         self.figures = {}
+        # Per-column results shared between charts, dropped if self.data is replaced
+        self._cache_data = self.data
+        self._dt_cache: Dict[str, pd.Series] = {}
+        self._vc_cache: Dict[str, pd.Series] = {}
+        self._notna_cache: Dict[str, np.ndarray] = {}
+    
+    def _check_cache(self):
+        """Clear cached column results if self.data is no longer the frame they came from."""
+        if self._cache_data is not self.data:
+            self._cache_data = self.data
+            self._dt_cache.clear()
+            self._vc_cache.clear()
+            self._notna_cache.clear()
+    
+    def _value_counts(self, field: str) -> pd.Series:
+        """
+        Return unsorted value counts of a column (nulls skipped), counting it only once.
+        
+        Charts take the top entries with nlargest, so the full set of
+        distinct values is never sorted.
+        """
+        self._check_cache()
+        counts = self._vc_cache.get(field)
+        if counts is None:
+            counts = self.data[field].value_counts(sort=False)
+            self._vc_cache[field] = counts
+        return counts
+    
+    def _notna(self, field: str) -> np.ndarray:
+        """Return a boolean mask of a column's non-null rows, scanning it only once."""
+        self._check_cache()
+        mask = self._notna_cache.get(field)
+        if mask is None:
+            mask = self.data[field].notna().to_numpy()
+            self._notna_cache[field] = mask
+        return mask
+    
+    def _has_any(self, field: str) -> bool:
+        """Return whether a column has any non-null value (from the cached mask)."""
+        return bool(self._notna(field).any())
+    
+    @staticmethod
+    def _empty_figure(text: str = "No data available") -> go.Figure:
+        """Return a blank figure carrying a centered message, for charts with no data."""
+        fig = go.Figure()
+        fig.add_annotation(
+            text=text,
+            xref="paper", yref="paper",
+            x=0.5, y=0.5, showarrow=False
+        )
+        return fig
+    
+    def _datetimes(self, field: str) -> pd.Series:
+        """Return a column parsed as datetimes (unparseable values as NaT), parsing it only once."""
+        self._check_cache()
+        dates = self._dt_cache.get(field)
+        if dates is None:
+            dates = _to_datetimes(self.data[field])
+            self._dt_cache[field] = dates
+        return dates
     
     def create_pie_chart(
         self, 
         field: str, 
         title: str = None,
         top_n: int = 10,
-        show_others: bool = True
+        show_others: bool = True,
+        counts: Optional[pd.Series] = None
     ) -> go.Figure:
         """
         Create a pie chart for categorical data.
@@ -65,36 +258,34 @@ class ChartGenerator:
             title: Chart title
             top_n: Number of top items to show
             show_others: Whether to group remaining items as "Others"
+            counts: Precomputed value_counts() of the field, so charts
+                sharing a column count it once
         
         Returns:
             Plotly Figure object
         """
-        if field not in self.data.columns:
+        if counts is None and field not in self.data.columns:
             raise ValueError(f"Field '{field}' not found in data")
         
-        # Count values
-        value_counts = self.data[field].dropna().value_counts()
+        if counts is None and not self._has_any(field):
+            return self._empty_figure()
+        
+        value_counts = self._value_counts(field) if counts is None else counts
         
         if len(value_counts) == 0:
-            # Return empty chart
-            fig = go.Figure()
-            fig.add_annotation(
-                text="No data available",
-                xref="paper", yref="paper",
-                x=0.5, y=0.5, showarrow=False
-            )
-            return fig
+            return self._empty_figure()
         
         # Get top N and optionally group others
         if len(value_counts) > top_n and show_others:
-            top_values = value_counts.head(top_n)
-            others_sum = value_counts.iloc[top_n:].sum()
+            top_values = value_counts.nlargest(top_n)
+            others_sum = value_counts.sum() - top_values.sum()
             
-            labels = list(top_values.index) + ['Others']
-            values = list(top_values.values) + [others_sum]
+            labels = np.append(top_values.index.to_numpy(dtype=object), 'Others')
+            values = np.append(top_values.to_numpy(), others_sum)
         else:
-            labels = list(value_counts.index)
-            values = list(value_counts.values)
+            value_counts = value_counts.nlargest(len(value_counts))
+            labels = value_counts.index.to_numpy(dtype=object)
+            values = value_counts.to_numpy()
         
         # Create pie chart
         fig = go.Figure(data=[go.Pie(
@@ -108,7 +299,7 @@ class ChartGenerator:
         
         fig.update_layout(
             title=title or f'{field.replace("_", " ").title()} Distribution',
-            template=self.theme,
+            **self._template,
             showlegend=True,
             height=500
         )
@@ -120,7 +311,8 @@ class ChartGenerator:
         field: str,
         title: str = None,
         top_n: int = 15,
-        horizontal: bool = True
+        horizontal: bool = True,
+        counts: Optional[pd.Series] = None
     ) -> go.Figure:
         """
         Create a bar chart for categorical data.
@@ -130,47 +322,52 @@ class ChartGenerator:
             title: Chart title
             top_n: Number of top items to show
             horizontal: Whether to create horizontal bars
+            counts: Precomputed value_counts() of the field, so charts
+                sharing a column count it once
         
         Returns:
             Plotly Figure object
         """
-        if field not in self.data.columns:
+        if counts is None and field not in self.data.columns:
             raise ValueError(f"Field '{field}' not found in data")
         
-        # Count values
-        value_counts = self.data[field].dropna().value_counts().head(top_n)
+        if counts is None and not self._has_any(field):
+            return self._empty_figure()
+        
+        value_counts = (self._value_counts(field) if counts is None else counts).nlargest(top_n)
         
         if len(value_counts) == 0:
-            fig = go.Figure()
-            fig.add_annotation(text="No data available", x=0.5, y=0.5, showarrow=False)
-            return fig
+            return self._empty_figure()
+        
+        labels = value_counts.index.to_numpy(dtype=object)
+        values = value_counts.to_numpy()
         
         # Create bar chart
         if horizontal:
             fig = go.Figure(data=[go.Bar(
-                y=value_counts.index,
-                x=value_counts.values,
+                y=labels,
+                x=values,
                 orientation='h',
                 marker=dict(
-                    color=value_counts.values,
+                    color=values,
                     colorscale='Viridis',
                     showscale=True
                 ),
-                text=value_counts.values,
+                text=values,
                 textposition='auto'
             )])
             fig.update_yaxes(title='')
             fig.update_xaxes(title='Count')
         else:
             fig = go.Figure(data=[go.Bar(
-                x=value_counts.index,
-                y=value_counts.values,
+                x=labels,
+                y=values,
                 marker=dict(
-                    color=value_counts.values,
+                    color=values,
                     colorscale='Viridis',
                     showscale=True
                 ),
-                text=value_counts.values,
+                text=values,
                 textposition='auto'
             )])
             fig.update_xaxes(title='')
@@ -178,18 +375,55 @@ class ChartGenerator:
         
         fig.update_layout(
             title=title or f'Top {top_n} {field.replace("_", " ").title()}',
-            template=self.theme,
+            **self._template,
             showlegend=False,
             height=500
         )
         
         return fig
     
+    def _period_counts(self, date_field: str, group_by: str) -> pd.DataFrame:
+        """
+        Count the parseable dates of a column per period.
+        
+        Args:
+            date_field: Date column name
+            group_by: Grouping period ('day', 'week', 'month', 'year')
+        
+        Returns:
+            DataFrame with 'period' labels in ascending order and their 'count'
+        """
+        dates = self._datetimes(date_field).dropna()
+        
+        # Group by period on the vectorized values; only the distinct periods
+        # are converted to labels afterwards
+        if group_by == 'day':
+            periods = dates.dt.floor('D')
+        elif group_by == 'week':
+            periods = dates.dt.to_period('W')
+        elif group_by == 'month':
+            periods = dates.dt.to_period('M')
+        elif group_by == 'year':
+            periods = dates.dt.year
+        else:
+            raise ValueError(f"Unknown group_by '{group_by}'")
+        
+        # Count per period without building a GroupBy: sorted codes, then bincount
+        codes, uniques = pd.factorize(periods, sort=True)
+        if group_by == 'day':
+            labels = uniques.date
+        elif group_by in ('week', 'month'):
+            labels = uniques.astype(str)
+        else:
+            labels = uniques
+        return pd.DataFrame({'period': labels, 'count': np.bincount(codes, minlength=len(uniques))})
+    
     def create_timeline(
         self,
         date_field: str = 'created_date',
         title: str = None,
-        group_by: str = 'day'
+        group_by: str = 'day',
+        max_points: int = _MAX_TIMELINE_POINTS
     ) -> go.Figure:
         """
         Create a timeline chart showing files over time.
@@ -198,6 +432,7 @@ class ChartGenerator:
             date_field: Date column name
             title: Chart title
             group_by: Grouping period ('day', 'week', 'month', 'year')
+            max_points: Periods beyond this are reduced with LTTB
         
         Returns:
             Plotly Figure object
@@ -205,33 +440,25 @@ class ChartGenerator:
         if date_field not in self.data.columns:
             raise ValueError(f"Field '{date_field}' not found in data")
         
-        # Convert to datetime
-        dates = pd.to_datetime(self.data[date_field], errors='coerce').dropna()
-        
-        if len(dates) == 0:
-            fig = go.Figure()
-            fig.add_annotation(text="No date data available", x=0.5, y=0.5, showarrow=False)
-            return fig
+        if not self._has_any(date_field):
+            return self._empty_figure("No date data available")
         
-        # Group by period
-        df_dates = pd.DataFrame({'date': dates})
+        counts = self._period_counts(date_field, group_by)
         
-        if group_by == 'day':
-            df_dates['period'] = df_dates['date'].dt.date
-        elif group_by == 'week':
-            df_dates['period'] = df_dates['date'].dt.to_period('W').astype(str)
-        elif group_by == 'month':
-            df_dates['period'] = df_dates['date'].dt.to_period('M').astype(str)
-        elif group_by == 'year':
-            df_dates['period'] = df_dates['date'].dt.year
+        if len(counts) == 0:
+            return self._empty_figure("No date data available")
         
-        counts = df_dates.groupby('period').size().reset_index(name='count')
+        # Long timelines are drawn with WebGL and keep only the points that shape the line
+        scatter = _scatter_cls(len(counts))
+        if len(counts) > max_points:
+            keep = _lttb(np.arange(len(counts)), counts['count'].to_numpy(), max_points)
+            counts = counts.iloc[keep]
         
         # Create timeline
         fig = go.Figure(data=[
-            go.Scatter(
-                x=counts['period'],
-                y=counts['count'],
+            scatter(
+                x=counts['period'].to_numpy(),
+                y=counts['count'].to_numpy(),
                 mode='lines+markers',
                 marker=dict(size=8),
                 line=dict(width=2),
@@ -244,9 +471,10 @@ class ChartGenerator:
             title=title or f'Files Over Time (by {group_by})',
             xaxis_title='Date',
             yaxis_title='Number of Files',
-            template=self.theme,
+            **self._template,
             height=500,
-            hovermode='x unified'
+            # Unified hover labels hit-test every point; WebGL timelines use plain x hover
+            hovermode='x unified' if scatter is go.Scatter else 'x'
         )
         
         return fig
@@ -257,7 +485,9 @@ class ChartGenerator:
         y_field: str,
         title: str = None,
         color_field: str = None,
-        size_field: str = None
+        size_field: str = None,
+        max_points: int = _MAX_SCATTER_POINTS,
+        hover_data: Optional[List[str]] = None
     ) -> go.Figure:
         """
         Create a scatter plot.
@@ -268,6 +498,10 @@ class ChartGenerator:
             title: Chart title
             color_field: Column for color coding
             size_field: Column for marker size
+            max_points: Rows beyond this are randomly sampled down
+            hover_data: Extra columns to show on hover; each one is embedded
+                per point in the figure, so by default only the plotted
+                fields are shown
         
         Returns:
             Plotly Figure object
@@ -275,14 +509,32 @@ class ChartGenerator:
         if x_field not in self.data.columns or y_field not in self.data.columns:
             raise ValueError(f"Fields '{x_field}' or '{y_field}' not found in data")
         
-        # Filter valid data
-        plot_data = self.data[[x_field, y_field]].dropna()
-        
-        if color_field and color_field in self.data.columns:
-            plot_data[color_field] = self.data.loc[plot_data.index, color_field]
-        
-        if size_field and size_field in self.data.columns:
-            plot_data[size_field] = self.data.loc[plot_data.index, size_field]
+        # Filter valid data, taking the color, size and hover columns in the same
+        # selection instead of adding them afterwards with index lookups
+        hover_data = [field for field in hover_data or [] if field in self.data.columns]
+        columns = [x_field, y_field] + [
+            field for field in (color_field, size_field)
+            if field and field in self.data.columns
+        ] + hover_data
+        rows = self._notna(x_field) & self._notna(y_field)
+        if not rows.any():
+            return self._empty_figure()
+        plot_data = self.data.loc[rows, list(dict.fromkeys(columns))]
+        
+        # Past this many points a random sample shows the same distribution;
+        # with color groups, each group is sampled in proportion to its size
+        if len(plot_data) > max_points:
+            if color_field in plot_data.columns:
+                groups = plot_data[color_field]
+                if isinstance(groups.dtype, pd.CategoricalDtype):
+                    # Group on the codes: missing values are code -1 rather than a
+                    # NaN key, which GroupBy.sample cannot look up
+                    groups = groups.cat.codes
+                plot_data = plot_data.groupby(groups, group_keys=False, dropna=False, observed=True).sample(
+                    frac=max_points / len(plot_data), random_state=0
+                )
+            else:
+                plot_data = plot_data.sample(max_points, random_state=0)
         
         # Create scatter plot
         fig = px.scatter(
@@ -291,9 +543,10 @@ class ChartGenerator:
             y=y_field,
             color=color_field if color_field else None,
             size=size_field if size_field else None,
-            template=self.theme,
+            **self._template,
             title=title or f'{y_field} vs {x_field}',
-            hover_data=plot_data.columns.tolist()
+            hover_data=hover_data or None,
+            render_mode='webgl'
         )
         
         fig.update_layout(height=500)
@@ -302,7 +555,7 @@ class ChartGenerator:
     
     def create_histogram(
         self,
-        field: str,
+        field: Union[str, pd.Series],
         title: str = None,
         bins: int = 30,
         show_stats: bool = True
@@ -311,37 +564,57 @@ class ChartGenerator:
         Create a histogram with optional statistical overlays.
         
         Args:
-            field: Column name to visualize
+            field: Column name to visualize, or a named Series of derived
+                values (e.g. a rescaled column) to plot without adding it
+                to the data
             title: Chart title
             bins: Number of bins
-            show_stats: Whether to show mean/median lines
+            show_stats: Whether to show mean/median lines (numeric fields)
         
         Returns:
             Plotly Figure object
         """
-        if field not in self.data.columns:
+        if isinstance(field, pd.Series):
+            values = field.dropna()
+            field = str(field.name)
+        elif field not in self.data.columns:
             raise ValueError(f"Field '{field}' not found in data")
-        
-        values = self.data[field].dropna()
+        elif not self._has_any(field):
+            return self._empty_figure()
+        else:
+            values = self.data[field][self._notna(field)]
         
         if len(values) == 0:
-            fig = go.Figure()
-            fig.add_annotation(text="No data available", x=0.5, y=0.5, showarrow=False)
-            return fig
-        
-        # Create histogram
-        fig = go.Figure(data=[go.Histogram(
-            x=values,
-            nbinsx=bins,
-            marker=dict(
-                color='rgba(100, 200, 255, 0.7)',
-                line=dict(color='rgba(100, 200, 255, 1)', width=1)
-            ),
-            hovertemplate='Range: %{x}<br>Count: %{y}<extra></extra>'
-        )])
+            return self._empty_figure()
+        
+        marker = dict(
+            color='rgba(100, 200, 255, 0.7)',
+            line=dict(color='rgba(100, 200, 255, 1)', width=1)
+        )
+        numeric = pd.api.types.is_numeric_dtype(values)
+        if numeric:
+            # Bin here and send bin counts as bars, rather than shipping every
+            # value for the browser to bin
+            counts, edges = np.histogram(values.to_numpy(dtype=float), bins=bins)
+            fig = go.Figure(data=[go.Bar(
+                x=(edges[:-1] + edges[1:]) / 2,
+                y=counts,
+                width=np.diff(edges),
+                customdata=np.column_stack([edges[:-1], edges[1:]]),
+                marker=marker,
+                hovertemplate='Range: %{customdata[0]:.4g} - %{customdata[1]:.4g}<br>Count: %{y}<extra></extra>'
+            )])
+        else:
+            # Strings, categoricals and dates are binned by plotly itself
+            fig = go.Figure(data=[go.Histogram(
+                x=values,
+                nbinsx=bins,
+                marker=marker,
+                hovertemplate='Range: %{x}<br>Count: %{y}<extra></extra>'
+            )])
         
         # Add statistical lines
-        if show_stats:
+        if show_stats and numeric:
             mean_val = values.mean()
             median_val = values.median()
             
@@ -365,7 +638,7 @@ class ChartGenerator:
             title=title or f'{field.replace("_", " ").title()} Distribution',
             xaxis_title=field.replace("_", " ").title(),
             yaxis_title='Frequency',
-            template=self.theme,
+            **self._template,
             height=500,
             showlegend=False
         )
@@ -392,25 +665,49 @@ class ChartGenerator:
         if field not in self.data.columns:
             raise ValueError(f"Field '{field}' not found in data")
         
+        if not self._has_any(field):
+            return self._empty_figure()
+        
         if group_by and group_by in self.data.columns:
             fig = px.box(
                 self.data,
                 y=field,
                 x=group_by,
-                template=self.theme,
+                **self._template,
                 title=title or f'{field} by {group_by}'
             )
         else:
-            fig = go.Figure(data=[go.Box(
-                y=self.data[field].dropna(),
-                name=field,
-                boxmean='sd'  # Show mean and standard deviation
-            )])
+            values = self.data[field][self._notna(field)]
+            if pd.api.types.is_numeric_dtype(values) and not pd.api.types.is_bool_dtype(values):
+                # Send the box statistics and outliers rather than every value
+                values = values.to_numpy(dtype=float)
+                q1, median, q3 = np.quantile(values, [0.25, 0.5, 0.75])
+                iqr = q3 - q1
+                # Whiskers end at the furthest values within 1.5 IQR of the box
+                inside = values[(values >= q1 - 1.5 * iqr) & (values <= q3 + 1.5 * iqr)]
+                lowerfence, upperfence = inside.min(), inside.max()
+                outliers = values[(values < lowerfence) | (values > upperfence)]
+                # A single value has no sample standard deviation
+                sd = values.std(ddof=1) if len(values) > 1 else 0.0
+                
+                box = go.Box(
+                    q1=[q1], median=[median], q3=[q3],
+                    lowerfence=[lowerfence], upperfence=[upperfence],
+                    mean=[values.mean()], sd=[sd],
+                    y=[outliers],
+                    name=field,
+                    boxmean='sd'  # Show mean and standard deviation
+                )
+            else:
+                # Dates, strings and categoricals go to plotly as values; it computes the box
+                box = go.Box(y=values, name=field, boxmean='sd')
+            
+            fig = go.Figure(data=[box])
             
             fig.update_layout(
                 title=title or f'{field.replace("_", " ").title()} Distribution',
                 yaxis_title=field.replace("_", " ").title(),
-                template=self.theme,
+                **self._template,
                 height=500
             )
         
@@ -436,19 +733,19 @@ class ChartGenerator:
         else:
             data_subset = self.data
         
-        # Create completeness matrix (1 if not null, 0 if null)
-        completeness = (~data_subset.isnull()).astype(int)
+        # Limit rows for readability, before checking them
+        if len(data_subset) > 100:
+            data_subset = data_subset.head(100)
         
-        # Limit rows for readability
-        if len(completeness) > 100:
-            completeness = completeness.head(100)
+        # Create completeness matrix (1 if not null, 0 if null) as uint8, a
+        # byte per cell in memory and in the serialized figure
+        completeness = data_subset.notna().to_numpy(dtype=np.uint8)
         
         fig = go.Figure(data=go.Heatmap(
-            z=completeness.values,
-            x=completeness.columns,
+            z=completeness,
+            x=data_subset.columns.to_numpy(dtype=object),
             y=[f"File {i+1}" for i in range(len(completeness))],
             colorscale=[[0, 'red'], [1, 'green']],
-            text=completeness.values,
             hovertemplate='Field: %{x}<br>File: %{y}<br>Present: %{z}<extra></extra>',
             showscale=True
         ))
@@ -457,7 +754,7 @@ class ChartGenerator:
             title=title,
             xaxis_title='Metadata Fields',
             yaxis_title='Files',
-            template=self.theme,
+            **self._template,
             height=max(500, len(completeness) * 10)
         )
         
@@ -468,7 +765,8 @@ class ChartGenerator:
         fig: go.Figure,
         filename: str,
         format: str = 'html',
-        output_dir: str = 'exports'
+        output_dir: str = 'exports',
+        include_plotlyjs: Union[bool, str] = True
     ):
         """
         Save a figure to file.
@@ -478,6 +776,10 @@ class ChartGenerator:
             filename: Output filename (without extension)
             format: Output format ('html', 'png', 'jpg', 'svg', 'pdf')
             output_dir: Output directory
+            include_plotlyjs: How HTML output loads plotly.js: True inlines
+                the full bundle so the file works offline, 'directory' shares
+                one plotly.min.js in output_dir, 'cdn' links it from the
+                network to keep the file small
         """
         # Create output directory
         Path(output_dir).mkdir(parents=True, exist_ok=True)
@@ -486,7 +788,7 @@ class ChartGenerator:
         filepath = os.path.join(output_dir, f"{filename}.{format}")
         
         if format == 'html':
-            fig.write_html(filepath)
+            fig.write_html(filepath, include_plotlyjs=include_plotlyjs)
         else:
             # Requires kaleido
             try:
@@ -496,61 +798,209 @@ class ChartGenerator:
                 print("Note: Install kaleido for image export: pip install kaleido")
                 # Fallback to HTML
                 html_path = os.path.join(output_dir, f"{filename}.html")
-                fig.write_html(html_path)
+                fig.write_html(html_path, include_plotlyjs=include_plotlyjs)
                 print(f"Saved as HTML instead: {html_path}")
         
         print(f"Figure saved: {filepath}")
     
-    def create_dashboard_charts(self) -> Dict[str, go.Figure]:
+    def save_figures(
+        self,
+        figures: Dict[str, go.Figure],
+        format: str = 'png',
+        output_dir: str = 'exports',
+        include_plotlyjs: Union[bool, str] = True
+    ):
         """
-        Create a complete set of dashboard charts.
+        Save several figures at once, named by their keys.
+        
+        Image formats are rendered in one batch with plotly.io.write_images
+        (plotly 6.1+ with kaleido 1.x), which starts the headless browser
+        once for all figures instead of once per save_figure call.
+        
+        Args:
+            figures: Dictionary of filenames (without extension) to figures
+            format: Output format ('html', 'png', 'jpg', 'svg', 'pdf')
+            output_dir: Output directory
+            include_plotlyjs: How HTML output loads plotly.js (see save_figure)
+        """
+        write_images = getattr(pio, 'write_images', None)
+        if format == 'html' or write_images is None:
+            for filename, fig in figures.items():
+                self.save_figure(fig, filename, format, output_dir, include_plotlyjs)
+            return
+        
+        Path(output_dir).mkdir(parents=True, exist_ok=True)
+        filepaths = [os.path.join(output_dir, f"{filename}.{format}") for filename in figures]
+        
+        try:
+            write_images(list(figures.values()), filepaths, format=format)
+        except Exception as e:
+            print(f"Error saving images: {e}")
+            print("Note: Install kaleido for image export: pip install kaleido")
+            # Fallback to HTML
+            for filename, fig in figures.items():
+                self.save_figure(fig, filename, 'html', output_dir, include_plotlyjs)
+            return
+        
+        for filepath in filepaths:
+            print(f"Figure saved: {filepath}")
+    
+    def export_feather(self, output_dir: str = 'exports') -> Dict[str, str]:
+        """
+        Write the aggregated tables behind the dashboard charts as Feather files.
+        
+        Other tools can load these small tables and redraw the charts without
+        the full metadata frame. Counts tables come back in as the counts=
+        argument of create_pie_chart / create_bar_chart via counts_from_feather.
+        Requires pyarrow.
+        
+        Args:
+            output_dir: Output directory
         
         Returns:
-            Dictionary of chart names to Figure objects
+            Dictionary of table names to the files written
         """
-        charts = {}
+        tables = {}
+        
+        # Category counts, kept categorical so Arrow stores them dictionary-encoded
+        for field in ('file_type', 'camera_model'):
+            if field in self.data.columns:
+                counts = self._value_counts(field)
+                tables[f'{field}_counts'] = pd.DataFrame({
+                    field: counts.index,
+                    'count': counts.to_numpy()
+                })
+        
+        # Files per day
+        if 'created_date' in self.data.columns:
+            tables['timeline'] = self._period_counts('created_date', 'day')
+        
+        # File size bins (MB), as create_histogram draws them
+        if 'file_size' in self.data.columns:
+            sizes = self.data['file_size'][self._notna('file_size')].to_numpy(dtype=float) / (1024 * 1024)
+            counts, edges = np.histogram(sizes, bins=30)
+            tables['file_size_hist'] = pd.DataFrame({
+                'bin_start': edges[:-1],
+                'bin_end': edges[1:],
+                'count': counts
+            })
+        
+        Path(output_dir).mkdir(parents=True, exist_ok=True)
+        
+        paths = {}
+        for name, table in tables.items():
+            filepath = os.path.join(output_dir, f"{name}.feather")
+            table.to_feather(filepath, compression='zstd')
+            paths[name] = filepath
+        
+        return paths
+    
+    @staticmethod
+    def counts_from_feather(filepath: Union[str, Path]) -> pd.Series:
+        """
+        Load a counts table written by export_feather as a value_counts Series.
+        
+        Args:
+            filepath: Path to a *_counts.feather file
+        
+        Returns:
+            Series of counts indexed by value, for the counts= argument of
+            create_pie_chart / create_bar_chart
+        """
+        table = pd.read_feather(filepath)
+        return table.set_index(table.columns[0])['count']
+    
+    @staticmethod
+    def write_live_html(fig: go.Figure, filepath: Union[str, Path], poll_ms: int = 5000, **kwargs):
+        """
+        Write a chart page that picks up later rewrites of the same chart.
+        
+        Besides the HTML, the figure is written to a sidecar script (same
+        name, .js extension) that the open page reloads every poll_ms and
+        applies with Plotly.react, so re-running the generator updates the
+        chart in place instead of needing a full page reload. The page keeps
+        polling for as long as it stays open, so use fig.write_html for
+        pages that are not meant to be watched.
+        
+        Args:
+            fig: Plotly Figure object
+            filepath: Output HTML path
+            poll_ms: Polling interval in milliseconds
+            **kwargs: Passed on to fig.write_html
+        """
+        filepath = Path(filepath)
+        sidecar = filepath.with_suffix('.js')
+        sidecar.write_text(f"window.updateFigure && updateFigure({fig.to_json()});\n", encoding='utf-8')
+        
+        post_script = _LIVE_UPDATE_JS.replace('{sidecar}', sidecar.name).replace('{poll_ms}', str(int(poll_ms)))
+        fig.write_html(str(filepath), post_script=post_script, **kwargs)
+    
+    def dashboard_chart_builders(self) -> Dict[str, Callable[[], go.Figure]]:
+        """
+        Get the dashboard charts as callables that build each figure on demand.
+        
+        Only the charts that are actually called do any work, so callers
+        showing a few charts skip the counting and grouping of the rest.
+        
+        Returns:
+            Dictionary of chart names to zero-argument figure builders
+        """
+        builders = {}
         
         # File type distribution
         if 'file_type' in self.data.columns:
-            charts['file_type_pie'] = self.create_pie_chart('file_type', 'File Type Distribution')
+            builders['file_type_pie'] = partial(self.create_pie_chart, 'file_type', 'File Type Distribution')
         
         # Camera distribution (for images)
         if 'camera_model' in self.data.columns:
-            charts['camera_bar'] = self.create_bar_chart('camera_model', 'Top Cameras Used')
+            builders['camera_bar'] = partial(self.create_bar_chart, 'camera_model', 'Top Cameras Used')
         
         # Timeline
         if 'created_date' in self.data.columns:
-            charts['timeline'] = self.create_timeline('created_date', 'Files Over Time')
+            builders['timeline'] = partial(self.create_timeline, 'created_date', 'Files Over Time')
         
         # File size distribution
         if 'file_size' in self.data.columns:
-            file_size_mb = self.data['file_size'] / (1024 * 1024)
-            temp_data = self.data.copy()
-            temp_data['file_size_mb'] = file_size_mb
-            temp_gen = ChartGenerator(temp_data, self.theme)
-            charts['file_size_hist'] = temp_gen.create_histogram('file_size_mb', 'File Size Distribution (MB)')
+            builders['file_size_hist'] = lambda: self.create_histogram(
+                self.data['file_size'].rename('file_size_mb') / (1024 * 1024),
+                'File Size Distribution (MB)'
+            )
         
         # Resolution scatter (if width and height available)
         if 'width' in self.data.columns and 'height' in self.data.columns:
-            charts['resolution_scatter'] = self.create_scatter_plot(
+            builders['resolution_scatter'] = partial(
+                self.create_scatter_plot,
                 'width', 'height', 
                 'Resolution Distribution',
                 color_field='file_type' if 'file_type' in self.data.columns else None
             )
         
-        return charts
+        return builders
+    
+    def create_dashboard_charts(self) -> Dict[str, go.Figure]:
+        """
+        Create a complete set of dashboard charts.
+        
+        Returns:
+            Dictionary of chart names to Figure objects
+        """
+        return {name: build() for name, build in self.dashboard_chart_builders().items()}
     
-    def show_all_charts(self, charts: Dict[str, go.Figure] = None):
+    def show_all_charts(self, charts: Dict[str, Union[go.Figure, Callable[[], go.Figure]]] = None):
         """
         Display all charts in browser.
         
         Args:
-            charts: Dictionary of charts (if None, creates dashboard charts)
+            charts: Dictionary of charts or figure builders (if None, uses
+                the dashboard chart builders); builders are called one at a
+                time as each chart is shown
         """
         if charts is None:
-            charts = self.create_dashboard_charts()
+            charts = self.dashboard_chart_builders()
         
         for name, fig in charts.items():
+            if callable(fig):
+                fig = fig()
             fig.show()
 
 